@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
 
-import re
+import argparse
+import string
 import sys
+from pathlib import Path
+from typing import FrozenSet, List, Optional, Tuple
 
 
-COMMENT_RE = re.compile('^([A-Z]{3}) ([a-zA-Z \(\)]+)$')
-IMPLIED_OPCODE_RE = re.compile('^([A-Z]{3}) ([a-zA-Z \(\)]+)\s{1,}\$([A-Z0-9]{2})+$')
-SIMPLE_OPCODE_RE = re.compile('^([a-zA-Z ,]+)\s{2,}([A-Z]{3})\s{1,}\$([A-Z0-9]{2})\s{1,}([0-9]{1})\s{1,}([0-9]{1})\+?$')
-ONLY_TIME_OPCODE_RE = re.compile('^([A-Z]{3}) ([a-zA-Z \(\)]+)\s{1,}\$([A-Z0-9]{2})+\s{1,}([0-9]{1})$')
-ADDR_MODE_OPCODE_RE = re.compile('^([a-zA-Z ,]+)\s{2,}([A-Z]{3}) [\#\$0-9,AXY\(\)]+\s{1,}\$([A-Z0-9]{2})\s{1,}([0-9]{1})\s{1,}([0-9]{1})\+?$')
+# Characters allowed in the description of a "XXX (Description)" mnemonic header line
+COMMENT_CHARS = frozenset(string.ascii_letters + ' ()')
+
+# Characters allowed in the addressing mode column of a table row, and in the operand after its mnemonic
+MODE_CHARS = frozenset(string.ascii_letters + ' ,')
+OPERAND_CHARS = frozenset(string.digits + '#$,AXY()')
+
+HEX_DIGITS = frozenset(string.digits + 'ABCDEF')
 
 SUFFIX_MAP = {
     'Absolute': '_ABS',    
@@ -39,310 +45,485 @@ ADDRESSING_MODES = set([
     "ZPY"]
 )
 
+BRANCH_MNEMONICS = frozenset([
+    "BCC",
+    "BCS",
+    "BEQ",
+    "BMI",
+    "BNE",
+    "BPL",
+    "BVC",
+    "BVS"]
+)
+
 PAGE_BOUNDARY_PENALTY_MODES = set([
     "ABX",
     "ABY",
     "INY"]
 )
 
-def main():
-    opcodes = {}
-
-    for l in open('opcodes/opcodes.txt'):
-        m = COMMENT_RE.match(l)
-        if m:
-            comment = m.group(2)
-
-        m = ADDR_MODE_OPCODE_RE.match(l)
-        if m:
-            basename = m.group(2)
-            suffix = m.group(1)
-            opcode = m.group(3)
-            size = m.group(4)
-            time = m.group(5)
-            opcodes[basename + SUFFIX_MAP[suffix.strip()]] = (opcode, size, time, comment)
-
-        m = ONLY_TIME_OPCODE_RE.match(l)
-        if m:
-            basename = m.group(1)
-            comment = m.group(2)
-            opcode = m.group(3)
-            time = m.group(4)
-            opcodes[basename] = (opcode, 1, time,  comment)
-
-        m = SIMPLE_OPCODE_RE.match(l)
-        if m:
-            basename = m.group(2)
-            suffix = m.group(1)
-            opcode = m.group(3)
-            size = m.group(4)
-            time = m.group(5)
-            opcodes[basename + SUFFIX_MAP[suffix.strip()]] = (opcode, size, time, comment)
-
-        m = IMPLIED_OPCODE_RE.match(l)
-        if m:
-            basename = m.group(1)
-            comment = m.group(2)
-            if "Branch" in comment:
-                size = 2
-            else:
-                size = 1
-            opcode = m.group(3)
-            opcodes[basename] = (opcode, size, 2, comment)
-
-    # Unofficial opcodes from nesttest.log:
-    # http://ist.uwaterloo.ca/~schepers/MJK/ascii/65xx_ill.txt
-
+# Unofficial opcodes from nesttest.log:
+# http://ist.uwaterloo.ca/~schepers/MJK/ascii/65xx_ill.txt
+UNOFFICIAL_OPCODES = {
     # LAX
     # E545  A3 40    *LAX ($40,X) @ 43 = 0580 = 55    A:00 X:03 Y:77 P:67 SP:FB PPU:134,134 CYC:15276
-    opcodes["LAX_INX"] = ("a3", 2, 6, "LAX = LDA + LDX (Unofficial opcode)")
+    "LAX_INX": ("a3", 2, 6, "LAX = LDA + LDX (Unofficial opcode)", "INX"),
     # E598  A7 67    *LAX $67 = 87                    A:00 X:AA Y:57 P:67 SP:FB PPU:135, 90 CYC:15375
-    opcodes["LAX_ZP"] = ("a7", 2, 3, "LAX = LDA + LDX (Unofficial opcode)")
+    "LAX_ZP": ("a7", 2, 3, "LAX = LDA + LDX (Unofficial opcode)", "ZP"),
     # E5EB  AF 77 05 *LAX $0577 = 87                  A:00 X:32 Y:57 P:67 SP:FB PPU:136, 28 CYC:15468
-    opcodes["LAX_ABS"] = ("af", 3, 4, "LAX = LDA + LDX (Unofficial opcode)")
+    "LAX_ABS": ("af", 3, 4, "LAX = LDA + LDX (Unofficial opcode)", "ABS"),
     # E652  B3 43    *LAX ($43),Y = 04FF @ 0580 = 55  A:00 X:03 Y:81 P:67 SP:FB PPU:137, 38 CYC:15585
-    opcodes["LAX_INY"] = ("b3", 2, 5, "LAX = LDA + LDX (Unofficial opcode)")
+    "LAX_INY": ("b3", 2, 5, "LAX = LDA + LDX (Unofficial opcode)", "INY"),
     # E6A5  B7 10    *LAX $10,Y @ 67 = 87             A:00 X:AA Y:57 P:67 SP:FB PPU:137,332 CYC:15683
-    opcodes["LAX_ZPY"] = ("b7", 2, 4, "LAX = LDA + LDX (Unofficial opcode)")
+    "LAX_ZPY": ("b7", 2, 4, "LAX = LDA + LDX (Unofficial opcode)", "ZPY"),
     # E6F8  BF 57 05 *LAX $0557,Y @ 0587 = 87         A:00 X:32 Y:30 P:67 SP:FB PPU:138,276 CYC:15778
-    opcodes["LAX_ABY"] = ("bf", 3, 4, "LAX = LDA + LDX (Unofficial opcode)")
+    "LAX_ABY": ("bf", 3, 4, "LAX = LDA + LDX (Unofficial opcode)", "ABY"),
 
     # SAX
     # E757  83 49    *SAX ($49,X) @ 60 = 0489 = 00    A:3E X:17 Y:44 P:E6 SP:FB PPU:139,289 CYC:15896
-    opcodes["SAX_INX"] = ("83", 2, 6, "SAX = Store A&X (Unofficial opcode)")
+    "SAX_INX": ("83", 2, 6, "SAX = Store A&X (Unofficial opcode)", "INX"),
     # E7B6  87 49    *SAX $49 = FF                    A:55 X:AA Y:44 P:E4 SP:FB PPU:140,284 CYC:16008
-    opcodes["SAX_ZP"] = ("87", 2, 3, "SAX = Store A&X (Unofficial opcode)")
+    "SAX_ZP": ("87", 2, 3, "SAX = Store A&X (Unofficial opcode)", "ZP"),
     # E818  8F 49 05 *SAX $0549 = FF                  A:F5 X:AF Y:E5 P:E4 SP:FB PPU:141,273 CYC:16118
-    opcodes["SAX_ABS"] = ("8f", 3, 4, "SAX = Store A&X (Unofficial opcode)")
+    "SAX_ABS": ("8f", 3, 4, "SAX = Store A&X (Unofficial opcode)", "ABS"),
     # E87E  97 4A    *SAX $4A,Y @ 49 = FF             A:55 X:AA Y:FF P:E4 SP:FB PPU:142,274 CYC:16232
-    opcodes["SAX_ZPY"] = ("97", 2, 4, "SAX = Store A&X (Unofficial opcode)")
+    "SAX_ZPY": ("97", 2, 4, "SAX = Store A&X (Unofficial opcode)", "ZPY"),
 
     # SBC
     # E8D8  EB 40    *SBC #$40                        A:40 X:EF Y:90 P:65 SP:FB PPU:143,317 CYC:16360
-    opcodes["SNC_IMM"] = ("eb", 2, 2, "SNC = SBC + NOP (Unofficial opcode)")
+    "SNC_IMM": ("eb", 2, 2, "SNC = SBC + NOP (Unofficial opcode)", "IMM"),
 
     # DCP
     # E92E  C3 45    *DCP ($45,X) @ 47 = 0647 = EB    A:40 X:02 Y:95 P:64 SP:FB PPU:146,173 CYC:16653
-    opcodes["DCP_INX"] = ("c3", 2, 8, "DCP = DEC + CMP (Unofficial opcode)")
+    "DCP_INX": ("c3", 2, 8, "DCP = DEC + CMP (Unofficial opcode)", "INX"),
     # E97E  C7 47    *DCP $47 = EB                    A:40 X:02 Y:98 P:64 SP:FB PPU:148,160 CYC:16876
-    opcodes["DCP_ZP"] = ("c7", 2, 5, "DCP = DEC + CMP (Unofficial opcode)")
+    "DCP_ZP": ("c7", 2, 5, "DCP = DEC + CMP (Unofficial opcode)", "ZP"),
     # E9CA  CF 47 06 *DCP $0647 = EB                  A:40 X:02 Y:9B P:64 SP:FB PPU:150,108 CYC:17086
-    opcodes["DCP_ABS"] = ("cf", 3, 6, "DCP = DEC + CMP (Unofficial opcode)")
+    "DCP_ABS": ("cf", 3, 6, "DCP = DEC + CMP (Unofficial opcode)", "ABS"),
     # EA27  D3 45    *DCP ($45),Y = 0548 @ 0647 = EB  A:40 X:02 Y:FF P:64 SP:FB PPU:152,110 CYC:17314
-    opcodes["DCP_INY"] = ("d3", 2, 7, "DCP = DEC + CMP (Unofficial opcode)")
+    "DCP_INY": ("d3", 2, 7, "DCP = DEC + CMP (Unofficial opcode)", "INY"),
     # EA88  D7 48    *DCP $48,X @ 47 = EB             A:40 X:FF Y:A1 P:64 SP:FB PPU:154,211 CYC:17575
-    opcodes["DCP_ZPX"] = ("d7", 2, 6, "DCP = DEC + CMP (Unofficial opcode)")
+    "DCP_ZPX": ("d7", 2, 6, "DCP = DEC + CMP (Unofficial opcode)", "ZPX"),
     # EAD5  DB 48 05 *DCP $0548,Y @ 0647 = EB         A:40 X:FF Y:FF P:64 SP:FB PPU:156,168 CYC:17788
-    opcodes["DCP_ABY"] = ("db", 3, 6, "DCP = DEC + CMP (Unofficial opcode)")
+    "DCP_ABY": ("db", 3, 6, "DCP = DEC + CMP (Unofficial opcode)", "ABY"),
     # EB3A  DF 48 05 *DCP $0548,X @ 0647 = EB         A:40 X:FF Y:A7 P:64 SP:FB PPU:158,263 CYC:18047
-    opcodes["DCP_ABX"] = ("df", 3, 6, "DCP = DEC + CMP (Unofficial opcode)")
+    "DCP_ABX": ("df", 3, 6, "DCP = DEC + CMP (Unofficial opcode)", "ABX"),
 
     # ISB
     # EB9E  E3 45    *ISB ($45,X) @ 47 = 0647 = EB    A:40 X:02 Y:AA P:64 SP:FB PPU:160,331 CYC:18297
-    opcodes["ISB_INX"] = ("e3", 2, 8, "ISB = INC + SBC (Unofficial opcode)")
+    "ISB_INX": ("e3", 2, 8, "ISB = INC + SBC (Unofficial opcode)", "INX"),
     # EBEE  E7 47    *ISB $47 = EB                    A:40 X:02 Y:AD P:64 SP:FB PPU:162,324 CYC:18522
-    opcodes["ISB_ZP"] = ("e7", 2, 5, "ISB = INC + SBC (Unofficial opcode)")
+    "ISB_ZP": ("e7", 2, 5, "ISB = INC + SBC (Unofficial opcode)", "ZP"),
     # EC3A  EF 47 06 *ISB $0647 = EB                  A:40 X:02 Y:B0 P:64 SP:FB PPU:164,278 CYC:18734
-    opcodes["ISB_ABS"] = ("ef", 3, 6, "ISB = INC + SBC (Unofficial opcode)")
+    "ISB_ABS": ("ef", 3, 6, "ISB = INC + SBC (Unofficial opcode)", "ABS"),
     # EC97  F3 45    *ISB ($45),Y = 0548 @ 0647 = EB  A:40 X:02 Y:FF P:64 SP:FB PPU:166,286 CYC:18964
-    opcodes["ISB_INY"] = ("f3", 2, 7, "ISB = INC + SBC (Unofficial opcode)")
+    "ISB_INY": ("f3", 2, 7, "ISB = INC + SBC (Unofficial opcode)", "INY"),
     # ECF8  F7 48    *ISB $48,X @ 47 = EB             A:40 X:FF Y:B6 P:64 SP:FB PPU:169, 52 CYC:19227
-    opcodes["ISB_ZPX"] = ("f7", 2, 6, "ISB = INC + SBC (Unofficial opcode)")
+    "ISB_ZPX": ("f7", 2, 6, "ISB = INC + SBC (Unofficial opcode)", "ZPX"),
     # ED45  FB 48 05 *ISB $0548,Y @ 0647 = EB         A:40 X:FF Y:FF P:64 SP:FB PPU:171, 15 CYC:19442
-    opcodes["ISB_ABY"] = ("fb", 3, 6, "ISB = INC + SBC (Unofficial opcode)")
+    "ISB_ABY": ("fb", 3, 6, "ISB = INC + SBC (Unofficial opcode)", "ABY"),
     # EDAA  FF 48 05 *ISB $0548,X @ 0647 = EB         A:40 X:FF Y:BC P:64 SP:FB PPU:173,116 CYC:19703
-    opcodes["ISB_ABX"] = ("ff", 3, 6, "ISB = INC + SBC (Unofficial opcode)")
+    "ISB_ABX": ("ff", 3, 6, "ISB = INC + SBC (Unofficial opcode)", "ABX"),
 
     # SLO
     # EE0E  03 45    *SLO ($45,X) @ 47 = 0647 = A5    A:B3 X:02 Y:BF P:E4 SP:FB PPU:175,190 CYC:19955
-    opcodes["SLO_INX"] = ("03", 2, 8, "SLO = ASL + ORA (Unofficial opcode)")
+    "SLO_INX": ("03", 2, 8, "SLO = ASL + ORA (Unofficial opcode)", "INX"),
     # EE5E  07 47    *SLO $47 = A5                    A:B3 X:02 Y:C2 P:E4 SP:FB PPU:177,180 CYC:20179
-    opcodes["SLO_ZP"] = ("07", 2, 5, "SLO = ASL + ORA (Unofficial opcode)")
+    "SLO_ZP": ("07", 2, 5, "SLO = ASL + ORA (Unofficial opcode)", "ZP"),
     # EEAA  0F 47 06 *SLO $0647 = A5                  A:B3 X:02 Y:C5 P:E4 SP:FB PPU:179,131 CYC:20390
-    opcodes["SLO_ABS"] = ("0f", 3, 6, "SLO = ASL + ORA (Unofficial opcode)")
+    "SLO_ABS": ("0f", 3, 6, "SLO = ASL + ORA (Unofficial opcode)", "ABS"),
     # EF07  13 45    *SLO ($45),Y = 0548 @ 0647 = A5  A:B3 X:02 Y:FF P:E4 SP:FB PPU:181,136 CYC:20619
-    opcodes["SLO_INY"] = ("13", 2, 7, "SLO = ASL + ORA (Unofficial opcode)")
+    "SLO_INY": ("13", 2, 7, "SLO = ASL + ORA (Unofficial opcode)", "INY"),
     # EF68  17 48    *SLO $48,X @ 47 = A5             A:B3 X:FF Y:CB P:E4 SP:FB PPU:183,240 CYC:20881
-    opcodes["SLO_ZPX"] = ("17", 2, 6, "SLO = ASL + ORA (Unofficial opcode)")
+    "SLO_ZPX": ("17", 2, 6, "SLO = ASL + ORA (Unofficial opcode)", "ZPX"),
     # EFB5  1B 48 05 *SLO $0548,Y @ 0647 = A5         A:B3 X:FF Y:FF P:E4 SP:FB PPU:185,200 CYC:21095
-    opcodes["SLO_ABY"] = ("1b", 3, 6, "SLO = ASL + ORA (Unofficial opcode)")
+    "SLO_ABY": ("1b", 3, 6, "SLO = ASL + ORA (Unofficial opcode)", "ABY"),
     # F01A  1F 48 05 *SLO $0548,X @ 0647 = A5         A:B3 X:FF Y:D1 P:E4 SP:FB PPU:187,298 CYC:21355
-    opcodes["SLO_ABX"] = ("1f", 3, 6, "SLO = ASL + ORA (Unofficial opcode)")
+    "SLO_ABX": ("1f", 3, 6, "SLO = ASL + ORA (Unofficial opcode)", "ABX"),
 
     # RLA
     # F07E  23 45    *RLA ($45,X) @ 47 = 0647 = A5    A:B3 X:02 Y:D4 P:E4 SP:FB PPU:190, 28 CYC:21606
-    opcodes["RLA_INX"] = ("23", 2, 8, "RLA = ROL + AND (Unofficial opcode)")
+    "RLA_INX": ("23", 2, 8, "RLA = ROL + AND (Unofficial opcode)", "INX"),
     # F0CE  27 47    *RLA $47 = A5                    A:B3 X:02 Y:D7 P:E4 SP:FB PPU:192, 21 CYC:21831
-    opcodes["RLA_ZP"] = ("27", 2, 5, "RLA = ROL + AND (Unofficial opcode)")
+    "RLA_ZP": ("27", 2, 5, "RLA = ROL + AND (Unofficial opcode)", "ZP"),
     # F11A  2F 47 06 *RLA $0647 = A5                  A:B3 X:02 Y:DA P:E4 SP:FB PPU:193,316 CYC:22043
-    opcodes["RLA_ABS"] = ("2f", 3, 6, "RLA = ROL + AND (Unofficial opcode)")
+    "RLA_ABS": ("2f", 3, 6, "RLA = ROL + AND (Unofficial opcode)", "ABS"),
     # F177  33 45    *RLA ($45),Y = 0548 @ 0647 = A5  A:B3 X:02 Y:FF P:E4 SP:FB PPU:195,324 CYC:22273
-    opcodes["RLA_INY"] = ("33", 2, 7, "RLA = ROL + AND (Unofficial opcode)")
+    "RLA_INY": ("33", 2, 7, "RLA = ROL + AND (Unofficial opcode)", "INY"),
     # F1D8  37 48    *RLA $48,X @ 47 = A5             A:B3 X:FF Y:E0 P:E4 SP:FB PPU:198, 90 CYC:22536
-    opcodes["RLA_ZPX"] = ("37", 2, 6, "RLA = ROL + AND (Unofficial opcode)")
+    "RLA_ZPX": ("37", 2, 6, "RLA = ROL + AND (Unofficial opcode)", "ZPX"),
     # F225  3B 48 05 *RLA $0548,Y @ 0647 = A5         A:B3 X:FF Y:FF P:E4 SP:FB PPU:200, 53 CYC:22751
-    opcodes["RLA_ABY"] = ("3b", 3, 6, "RLA = ROL + AND (Unofficial opcode)")
+    "RLA_ABY": ("3b", 3, 6, "RLA = ROL + AND (Unofficial opcode)", "ABY"),
     # F28A  3F 48 05 *RLA $0548,X @ 0647 = A5         A:B3 X:FF Y:E6 P:E4 SP:FB PPU:202,154 CYC:23012
-    opcodes["RLA_ABX"] = ("3f", 3, 6, "RLA = ROL + AND (Unofficial opcode)")
+    "RLA_ABX": ("3f", 3, 6, "RLA = ROL + AND (Unofficial opcode)", "ABX"),
 
     # SRE
     # F2EE  43 45    *SRE ($45,X) @ 47 = 0647 = A5    A:B3 X:02 Y:E9 P:E4 SP:FB PPU:204,228 CYC:23264
-    opcodes["SRE_INX"] = ("43", 2, 8, "SRE = LSR + EOR (Unofficial opcode)")
+    "SRE_INX": ("43", 2, 8, "SRE = LSR + EOR (Unofficial opcode)", "INX"),
     # F33E  47 47    *SRE $47 = A5                    A:B3 X:02 Y:EC P:E4 SP:FB PPU:206,221 CYC:23489
-    opcodes["SRE_ZP"] = ("47", 2, 5, "SRE = LSR + EOR (Unofficial opcode)")
+    "SRE_ZP": ("47", 2, 5, "SRE = LSR + EOR (Unofficial opcode)", "ZP"),
     # F38A  4F 47 06 *SRE $0647 = A5                  A:B3 X:02 Y:EF P:E4 SP:FB PPU:208,172 CYC:23700
-    opcodes["SRE_ABS"] = ("4f", 3, 6, "SRE = LSR + EOR (Unofficial opcode))")
+    "SRE_ABS": ("4f", 3, 6, "SRE = LSR + EOR (Unofficial opcode))", "ABS"),
     # F3E7  53 45    *SRE ($45),Y = 0548 @ 0647 = A5  A:B3 X:02 Y:FF P:E4 SP:FB PPU:210,177 CYC:23929
-    opcodes["SRE_INY"] = ("53", 2, 7, "SRE = LSR + EOR (Unofficial opcode)")
+    "SRE_INY": ("53", 2, 7, "SRE = LSR + EOR (Unofficial opcode)", "INY"),
     # F448  57 48    *SRE $48,X @ 47 = A5             A:B3 X:FF Y:F5 P:E4 SP:FB PPU:212,281 CYC:24191
-    opcodes["SRE_ZPX"] = ("57", 2, 6, "SRE = LSR + EOR (Unofficial opcode)")
+    "SRE_ZPX": ("57", 2, 6, "SRE = LSR + EOR (Unofficial opcode)", "ZPX"),
     # F495  5B 48 05 *SRE $0548,Y @ 0647 = A5         A:B3 X:FF Y:FF P:E4 SP:FB PPU:214,241 CYC:24405
-    opcodes["SRE_ABY"] = ("5b", 3, 6, "SRE = LSR + EOR (Unofficial opcode)")
+    "SRE_ABY": ("5b", 3, 6, "SRE = LSR + EOR (Unofficial opcode)", "ABY"),
     # F4FA  5F 48 05 *SRE $0548,X @ 0647 = A5         A:B3 X:FF Y:FB P:E4 SP:FB PPU:216,339 CYC:24665
-    opcodes["SRE_ABX"] = ("5f", 3, 6, "SRE = LSR + EOR (Unofficial opcode)")
+    "SRE_ABX": ("5f", 3, 6, "SRE = LSR + EOR (Unofficial opcode)", "ABX"),
 
     # RRA
     # F55E  63 45    *RRA ($45,X) @ 47 = 0647 = A5    A:B2 X:02 Y:01 P:E4 SP:FB PPU:219,102 CYC:24927
-    opcodes["RRA_INX"] = ("63", 2, 8, "RRA = ROR + ADC (Unofficial opcode)")
+    "RRA_INX": ("63", 2, 8, "RRA = ROR + ADC (Unofficial opcode)", "INX"),
     # F5AE  67 47    *RRA $47 = A5                    A:B2 X:02 Y:04 P:E4 SP:FB PPU:221, 80 CYC:25147
-    opcodes["RRA_ZP"] = ("67", 2, 5, "RRA = ROR + ADC (Unofficial opcode)")
+    "RRA_ZP": ("67", 2, 5, "RRA = ROR + ADC (Unofficial opcode)", "ZP"),
     # F5FA  6F 47 06 *RRA $0647 = A5                  A:B2 X:02 Y:07 P:E4 SP:FB PPU:223, 19 CYC:25354
-    opcodes["RRA_ABS"] = ("6f", 3, 6, "RRA = ROR + ADC (Unofficial opcode)")
+    "RRA_ABS": ("6f", 3, 6, "RRA = ROR + ADC (Unofficial opcode)", "ABS"),
     # F657  73 45    *RRA ($45),Y = 0548 @ 0647 = A5  A:B2 X:02 Y:FF P:E4 SP:FB PPU:225, 12 CYC:25579
-    opcodes["RRA_INY"] = ("73", 2, 7, "RRA = ROR + ADC (Unofficial opcode)")
+    "RRA_INY": ("73", 2, 7, "RRA = ROR + ADC (Unofficial opcode)", "INY"),
     # F6B8  77 48    *RRA $48,X @ 47 = A5             A:B2 X:FF Y:0D P:E4 SP:FB PPU:227,104 CYC:25837
-    opcodes["RRA_ZPX"] = ("77", 2, 6, "RRA = ROR + ADC (Unofficial opcode)")
+    "RRA_ZPX": ("77", 2, 6, "RRA = ROR + ADC (Unofficial opcode)", "ZPX"),
     # F705  7B 48 05 *RRA $0548,Y @ 0647 = A5         A:B2 X:FF Y:FF P:E4 SP:FB PPU:229, 52 CYC:26047
-    opcodes["RRA_ABY"] = ("7b", 3, 6, "RRA = ROR + ADC (Unofficial opcode)")
+    "RRA_ABY": ("7b", 3, 6, "RRA = ROR + ADC (Unofficial opcode)", "ABY"),
     # F76A  7F 48 05 *RRA $0548,X @ 0647 = A5         A:B2 X:FF Y:13 P:E4 SP:FB PPU:231,138 CYC:26303
-    opcodes["RRA_ABX"] = ("7f", 3, 6, "RRA = ROR + ADC (Unofficial opcode)")
+    "RRA_ABX": ("7f", 3, 6, "RRA = ROR + ADC (Unofficial opcode)", "ABX"),
 
     # NOP with ABX, needed for page boundary penalty chek
     # C6F2  1C A9 A9 *NOP $A9A9,X @ A9A9 = A9         A:55 X:00 Y:53 P:24 SP:F1 PPU:132, 96 CYC:15036
-    opcodes["N1C_ABX"] = ("1c", 3, 4, "NOP (Unofficial opcode)")
+    "N1C_ABX": ("1c", 3, 4, "NOP (Unofficial opcode)", "ABX"),
     # C6F5  3C A9 A9 *NOP $A9A9,X @ A9A9 = A9         A:55 X:00 Y:53 P:24 SP:F1 PPU:132,108 CYC:15040
-    opcodes["N3C_ABX"] = ("3c", 3, 4, "NOP (Unofficial opcode)")
+    "N3C_ABX": ("3c", 3, 4, "NOP (Unofficial opcode)", "ABX"),
     # C6F8  5C A9 A9 *NOP $A9A9,X @ A9A9 = A9         A:55 X:00 Y:53 P:24 SP:F1 PPU:132,120 CYC:15044
-    opcodes["N5C_ABX"] = ("5c", 3, 4, "NOP (Unofficial opcode)")
+    "N5C_ABX": ("5c", 3, 4, "NOP (Unofficial opcode)", "ABX"),
     # C6FB  7C A9 A9 *NOP $A9A9,X @ A9A9 = A9         A:55 X:00 Y:53 P:24 SP:F1 PPU:132,132 CYC:15048
-    opcodes["N7C_ABX"] = ("7c", 3, 4, "NOP (Unofficial opcode)")
+    "N7C_ABX": ("7c", 3, 4, "NOP (Unofficial opcode)", "ABX"),
     # C6FE  DC A9 A9 *NOP $A9A9,X @ A9A9 = A9         A:55 X:00 Y:53 P:24 SP:F1 PPU:132,144 CYC:15052
-    opcodes["NDC_ABX"] = ("dc", 3, 4, "NOP (Unofficial opcode)")
+    "NDC_ABX": ("dc", 3, 4, "NOP (Unofficial opcode)", "ABX"),
     # C701  FC A9 A9 *NOP $A9A9,X @ A9A9 = A9         A:55 X:00 Y:53 P:24 SP:F1 PPU:132,156 CYC:15056
-    opcodes["NFC_ABX"] = ("fc", 3, 4, "NOP (Unofficial opcode)")
+    "NFC_ABX": ("fc", 3, 4, "NOP (Unofficial opcode)", "ABX"),
 
     # NOP with ZPX, needed for cycle accuracy
     # C6D2  14 A9    *NOP $A9,X @ A9 = 00             A:55 X:00 Y:53 P:24 SP:F5 PPU:131,239 CYC:14970
-    opcodes["NOP_14"] = ("14", 2, 4, "NOP (Unofficial opcode)")
+    "NOP_14": ("14", 2, 4, "NOP (Unofficial opcode)", "NA"),
     # C6D4  34 A9    *NOP $A9,X @ A9 = 00             A:55 X:00 Y:53 P:24 SP:F5 PPU:131,251 CYC:14974
-    opcodes["NOP_34"] = ("34", 2, 4, "NOP (Unofficial opcode)")
+    "NOP_34": ("34", 2, 4, "NOP (Unofficial opcode)", "NA"),
     # C6D6  54 A9    *NOP $A9,X @ A9 = 00             A:55 X:00 Y:53 P:24 SP:F5 PPU:131,263 CYC:14978
-    opcodes["NOP_54"] = ("54", 2, 4, "NOP (Unofficial opcode)")
+    "NOP_54": ("54", 2, 4, "NOP (Unofficial opcode)", "NA"),
     # C6D8  74 A9    *NOP $A9,X @ A9 = 00             A:55 X:00 Y:53 P:24 SP:F5 PPU:131,275 CYC:14982
-    opcodes["NOP_74"] = ("74", 2, 4, "NOP (Unofficial opcode)")
+    "NOP_74": ("74", 2, 4, "NOP (Unofficial opcode)", "NA"),
     # C6DA  D4 A9    *NOP $A9,X @ A9 = 00             A:55 X:00 Y:53 P:24 SP:F5 PPU:131,287 CYC:14986
-    opcodes["NOP_D4"] = ("d4", 2, 4, "NOP (Unofficial opcode)")
+    "NOP_D4": ("d4", 2, 4, "NOP (Unofficial opcode)", "NA"),
     # C6DC  F4 A9    *NOP $A9,X @ A9 = 00             A:55 X:00 Y:53 P:24 SP:F5 PPU:131,299 CYC:14990
-    opcodes["NOP_F4"] = ("f4", 2, 4, "NOP (Unofficial opcode)")
-
-    print("// GENERATED BY generate_opcodes.py")
-    print("")
-
-    for i, mode in enumerate(sorted(ADDRESSING_MODES)):
-        print("pub const ADDR_MODE_" + mode + ": usize = " + str(i) + ";")
-    print("")
-
-    for key, (opcode, size, time, comment) in opcodes.items():
-        print('pub const ' + key + ': u8 = 0x' + opcode.lower() + "; " + "// " + comment)
-
-    print("""
-pub struct Opcode {
-    name: &'static str,
-    size: u16,
-    #[allow(dead_code)]
-    cycles: u8,
-    mode: usize,
-    page_boundary_penalty: bool
+    "NOP_F4": ("f4", 2, 4, "NOP (Unofficial opcode)", "NA"),
 }
 
-pub struct Lookup {
-    opcodes: [&'static Opcode; 256],
-}
+OPCODE_CONST_TEMPLATE = "pub const {key}: u8 = 0x{opcode}; // {comment}\n"
 
-static _SENTINEL: Opcode = Opcode {
-    name: "NOP",
-    size: 0xffff, // Inaccurate, will have to be adjusted
-    cycles: 0xff, // Inaccurate, will have to be adjusted
-    mode: ADDR_MODE_NA,
-    page_boundary_penalty: false
-};
+ARRAY_TEMPLATE = """static {name}: [{rust_type}; {length}] = [
+{rows}];
+"""
 
+# All opcode names, each distinct name stored once, sliced out by NAME_SPANS
+NAMES_BLOB_TEMPLATE = """static NAMES_BLOB: &str = concat!(
+{rows});
+"""
+
+LOOKUP_IMPL = """
 impl Lookup {
-    pub fn new() -> Lookup {
-        let mut lookup: [&'static Opcode; 256] = [&_SENTINEL; 256];""")
-    
-    for key, (opcode, size, time, comment) in opcodes.items():
-        mode = "ADDR_MODE_" + key[4:] if len(key) > 3 and key[4:] in ADDRESSING_MODES else "ADDR_MODE_NA"
-        basename = key[:3]
-        print("        lookup[" + key  + " as usize] = &Opcode { " + "// " + comment)
-        print("            name: \"" + key + "\",")
-        print("            size: " + str(size) + ",")
-        print("            cycles: " + str(time) + ",")
-        print("            mode: " + mode + ",")
-        print("            page_boundary_penalty: " + str(mode[-3:] in PAGE_BOUNDARY_PENALTY_MODES and basename != "STA").lower() + ",")
-        print("        };")
-
-    print("""        Lookup { opcodes: lookup }
+    pub const fn new() -> Lookup {
+        Lookup
     }
 
+    #[inline(always)]
     pub fn name(&self, opcode: u8) -> &str {
-        self.opcodes[opcode as usize].name
+        let (offset, len) = NAME_SPANS[opcode as usize];
+        &NAMES_BLOB[offset as usize..offset as usize + len as usize]
     }
 
+    #[inline(always)]
     pub fn size(&self, opcode: u8) -> u16 {
-        let size = self.opcodes[opcode as usize].size;
-        if size == 0xffff {
-            // Handle NOPs
-            // https://wiki.nesdev.com/w/index.php/CPU_unofficial_opcodes
-            match opcode & 0xf {
-                0x0 => 2, // #i
-                0x2 => 1, // #
-                0x4 => 2, // d
-                0xc => 3, // a
-                _ => {
-                    1
-                }
-            }
-        } else {
-            size
-        }
+        SIZES[opcode as usize]
     }
 
+    #[inline(always)]
     pub fn cycles(&self, opcode: u8) -> u8 {
-        let cycles = self.opcodes[opcode as usize].cycles;
-        if cycles == 0xff {
-            // Handle NOPs
-            match opcode & 0xf {
-                0x0 => 2,
-                0x2 => 2,
-                0x4 => 3,
-                0xc => 4,
-                _ => 2,
-            }
-        } else {
-            cycles
-        }
+        CYCLES[opcode as usize]
     }
 
+    #[inline(always)]
     pub fn mode(&self, opcode: u8) -> usize {
-        self.opcodes[opcode as usize].mode
+        MODES[opcode as usize]
     }
 
+    #[inline(always)]
     pub fn page_boundary_penalty(&self, opcode: u8) -> bool {
-        self.opcodes[opcode as usize].page_boundary_penalty
+        PAGE_BOUNDARY_PENALTIES[opcode as usize]
     }
-}""")
+}
+"""
+
+# Opcodes that aren't in the table are treated as unofficial NOPs, sized by their low nibble
+# https://wiki.nesdev.com/w/index.php/CPU_unofficial_opcodes
+NOP_SIZES = {
+    0x0: 2,  # #i
+    0x2: 1,  # #
+    0x4: 2,  # d
+    0xc: 3,  # a
+}
+
+NOP_CYCLES = {
+    0x0: 2,
+    0x2: 2,
+    0x4: 3,
+    0xc: 4,
+}
+
+# Values per row in the generated lookup arrays
+ROW_LENGTH = 8
+
+# (kind, basename, suffix, opcode, size, time, comment) for a classified line of opcodes.txt
+Line = Tuple[str, str, str, str, str, str, str]
+
+# (key, opcode, size, time, comment, mode) for an entry in the generated table
+Entry = Tuple[str, str, int, int, str, str]
+
+# Entries indexed by opcode byte, None for opcodes without an entry
+Table = List[Optional[Entry]]
+
+
+def is_hex_token(token: str) -> bool:
+    return len(token) == 3 and token[0] == '$' and HEX_DIGITS.issuperset(token[1:])
+
+
+def is_hex_pairs(token: str) -> bool:
+    return len(token) > 0 and len(token) % 2 == 0 and HEX_DIGITS.issuperset(token)
+
+
+def is_digit_token(token: str) -> bool:
+    return len(token) == 1 and token in string.digits
+
+
+def is_mnemonic_token(token: str) -> bool:
+    return len(token) == 3 and token.isalpha() and token.isascii() and token.isupper()
+
+
+def split_column(text: str, chars: FrozenSet[str], padding: int) -> Optional[str]:
+    """Return the column at the start of text, if text is a non-empty run of chars
+    followed by at least padding whitespace, else None.
+
+    Like the greedy regex group it replaces, the column keeps any trailing spaces
+    it can while leaving the padding its minimum.
+    """
+    column = text.rstrip()
+    trailing = text[len(column):]
+    end = min(len(text) - padding, len(column) + len(trailing) - len(trailing.lstrip(' ')))
+    if end < max(len(column), 1) or not chars.issuperset(column):
+        return None
+    return text[:end]
+
+
+def classify(l: str) -> Optional[Line]:
+    """Classify a line of opcodes.txt without regexes.
+
+    Returns (kind, basename, suffix, opcode, size, time, comment), with '' for the
+    fields a kind doesn't carry, or None if the line doesn't describe an opcode.
+    The suffix is already mapped through SUFFIX_MAP and the opcode is lower case hex.
+    Accepts exactly the lines the original COMMENT, IMPLIED, ONLY_TIME, SIMPLE and
+    ADDR_MODE regexes matched, except that $XX columns must be upper case hex.
+    """
+    if l.endswith('\n'):
+        l = l[:-1]
+
+    # Mnemonic lines: "XXX (Description)", optionally followed by $XX and a time
+    if is_mnemonic_token(l[:3]) and l[3:4] == ' ':
+        if '$' not in l:
+            comment = l[4:]
+            if comment and COMMENT_CHARS.issuperset(comment):
+                return ('comment', l[:3], '', '', '', '', comment)
+            return None
+
+        hex_column = l.index('$')
+        description = split_column(l[4:hex_column], COMMENT_CHARS, 1)
+        fields = l[hex_column + 1:].split()
+        # The regexes allowed repeated hex pairs here and kept the last one
+        if (description is not None and fields and is_hex_pairs(fields[0])
+                and l.startswith(fields[0], hex_column + 1) and not l[-1].isspace()):
+            if len(fields) == 1:
+                return ('implied', l[:3], '', fields[0][-2:].lower(), '', '', description)
+            if len(fields) == 2 and is_digit_token(fields[1]):
+                return ('only', l[:3], '', fields[0][-2:].lower(), '', fields[1], description)
+
+    # Addressing mode lines: MODE  [MNEMONIC OPERAND | MNEMONIC] $XX SIZE TIME[+]
+    hex_column = l.rfind('$')
+    if hex_column < 0 or l[-1:].isspace():
+        return None
+
+    fields = l[hex_column + 3:].split()
+    if (len(fields) != 2 or not is_hex_token(l[hex_column:hex_column + 3])
+            or not l[hex_column + 3:hex_column + 4].isspace() or not is_digit_token(fields[0])):
+        return None
+
+    size, time = fields[0], fields[1][:-1] if fields[1].endswith('+') else fields[1]
+    if not is_digit_token(time):
+        return None
+
+    row = l[:hex_column]
+    body = row.rstrip()
+    if len(body) == len(row):
+        return None
+
+    mode = split_column(body[:-3], MODE_CHARS, 2)
+    if is_mnemonic_token(body[-3:]) and mode is not None:
+        kind, basename = 'simple', body[-3:]
+    else:
+        # The mnemonic is separated from its operand by exactly one space
+        operand = body.split()[-1] if body else ''
+        start = len(body) - len(operand) - 4
+        if (start < 0 or not OPERAND_CHARS.issuperset(operand) or body[start + 3] != ' '
+                or not is_mnemonic_token(body[start:start + 3])):
+            return None
+
+        mode = split_column(body[:start], MODE_CHARS, 2)
+        if mode is None:
+            return None
+        kind, basename = 'addr', body[start:start + 3]
+
+    # The line is a real table row, so an unknown addressing mode should fail loudly
+    return (kind, basename, SUFFIX_MAP[mode.strip()], l[hex_column + 1:hex_column + 3].lower(), size, time, '')
+
+
+def put(table: Table, entry: Entry) -> None:
+    i = int(entry[1], 16)
+    existing = table[i]
+    if existing:
+        sys.exit(f"Duplicate opcode 0x{entry[1]}: {existing[0]} and {entry[0]}")
+    table[i] = entry
+
+
+def parse_opcodes(lines: List[str]) -> Table:
+    table: Table = [None] * 256
+    comment = ''
+
+    for l in lines:
+        line = classify(l)
+        if not line:
+            continue
+
+        kind, basename, suffix, opcode, size, time, line_comment = line
+
+        if kind == 'addr' or kind == 'simple':
+            mode = suffix[1:] if suffix[1:] in ADDRESSING_MODES else "NA"
+            put(table, (basename + suffix, opcode, int(size), int(time), comment, mode))
+
+        elif kind == 'comment':
+            comment = line_comment
+
+        elif kind == 'implied':
+            comment = line_comment
+            if basename in BRANCH_MNEMONICS:
+                implied_size = 2
+            else:
+                implied_size = 1
+            put(table, (basename, opcode, implied_size, 2, comment, "NA"))
+
+        elif kind == 'only':
+            comment = line_comment
+            put(table, (basename, opcode, 1, int(time), comment, "NA"))
+
+    return table
+
+
+def page_boundary_penalty(key: str, mode: str) -> str:
+    return str(mode in PAGE_BOUNDARY_PENALTY_MODES and key[:3] != "STA").lower()
+
+
+def rust_rows(values: List[str], comment: bool = True) -> str:
+    rows = []
+    for i in range(0, len(values), ROW_LENGTH):
+        row = f"    {', '.join(values[i:i + ROW_LENGTH])},"
+        rows.append(f"{row} // 0x{i:02x}\n" if comment else f"{row}\n")
+    return "".join(rows)
+
+
+def rust_array(name: str, rust_type: str, values: List[str]) -> str:
+    return ARRAY_TEMPLATE.format(name=name, rust_type=rust_type, length=len(values), rows=rust_rows(values))
+
+
+def rust_names(names: List[str]) -> str:
+    """Intern the opcode names into one NAMES_BLOB string and a NAME_SPANS array of
+    (offset, len) pairs into it, indexed by opcode."""
+    spans = {}
+    offset = 0
+    for name in names:
+        if name not in spans:
+            spans[name] = (offset, len(name))
+            offset += len(name)
+
+    blob = NAMES_BLOB_TEMPLATE.format(rows=rust_rows([f'"{name}"' for name in spans], comment=False))
+    return blob + "\n" + rust_array("NAME_SPANS", "(u16, u8)", [f"{spans[name]}" for name in names])
+
+
+def generate(table: Table) -> str:
+    addr_modes = "".join(f"pub const ADDR_MODE_{mode}: usize = {i};\n"
+                         for i, mode in enumerate(sorted(ADDRESSING_MODES)))
+
+    consts = "".join(OPCODE_CONST_TEMPLATE.format(key=key, opcode=opcode, comment=comment)
+                     for key, opcode, size, time, comment, mode in filter(None, table))
+
+    names = ["NOP"] * 256
+    sizes = [str(NOP_SIZES.get(i & 0xf, 1)) for i in range(256)]
+    cycles = [str(NOP_CYCLES.get(i & 0xf, 2)) for i in range(256)]
+    modes = ["ADDR_MODE_NA"] * 256
+    penalties = ["false"] * 256
+
+    for i, entry in enumerate(table):
+        if not entry:
+            continue
+
+        key, opcode, size, time, comment, mode = entry
+        names[i] = key
+        sizes[i] = str(size)
+        cycles[i] = str(time)
+        modes[i] = f"ADDR_MODE_{mode}"
+        penalties[i] = page_boundary_penalty(key, mode)
+
+    tables = "\n".join([
+        rust_names(names),
+        rust_array("SIZES", "u16", sizes),
+        rust_array("CYCLES", "u8", cycles),
+        rust_array("MODES", "usize", modes),
+        rust_array("PAGE_BOUNDARY_PENALTIES", "bool", penalties),
+    ])
+
+    return (f"// GENERATED BY generate_opcodes.py\n\n{addr_modes}\n{consts}\n"
+            f"pub struct Lookup;\n\n{tables}{LOOKUP_IMPL}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Generate the 6502 opcode lookup table.')
+    parser.add_argument('-o', '--output', help='write the generated Rust to this file instead of stdout')
+    args = parser.parse_args()
+
+    with open('opcodes/opcodes.txt') as f:
+        lines = f.read().splitlines()
+
+    table = parse_opcodes(lines)
+    for key, entry in UNOFFICIAL_OPCODES.items():
+        put(table, (key, *entry))
+
+    seen = set()
+    for key, *_ in filter(None, table):
+        if key in seen:
+            sys.exit("Duplicate opcode: " + key)
+        seen.add(key)
+
+    rust = generate(table)
+    if args.output:
+        Path(args.output).write_text(rust)
+    else:
+        sys.stdout.write(rust)
 
 
 if __name__ == '__main__':
-    sys.exit(main())
\ No newline at end of file
+    main()
\ No newline at end of file
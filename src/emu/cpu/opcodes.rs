@@ -11,1806 +11,458 @@ pub const ADDR_MODE_ZP: usize = 7;
 pub const ADDR_MODE_ZPX: usize = 8;
 pub const ADDR_MODE_ZPY: usize = 9;
 
-pub const ADC_IMM: u8 = 0x69; // (ADd with Carry)
-pub const ADC_ZP: u8 = 0x65; // (ADd with Carry)
-pub const ADC_ZPX: u8 = 0x75; // (ADd with Carry)
-pub const ADC_ABS: u8 = 0x6d; // (ADd with Carry)
-pub const ADC_ABX: u8 = 0x7d; // (ADd with Carry)
-pub const ADC_ABY: u8 = 0x79; // (ADd with Carry)
-pub const ADC_INX: u8 = 0x61; // (ADd with Carry)
-pub const ADC_INY: u8 = 0x71; // (ADd with Carry)
-pub const AND_IMM: u8 = 0x29; // (bitwise AND with accumulator)
-pub const AND_ZP: u8 = 0x25; // (bitwise AND with accumulator)
-pub const AND_ZPX: u8 = 0x35; // (bitwise AND with accumulator)
-pub const AND_ABS: u8 = 0x2d; // (bitwise AND with accumulator)
-pub const AND_ABX: u8 = 0x3d; // (bitwise AND with accumulator)
-pub const AND_ABY: u8 = 0x39; // (bitwise AND with accumulator)
-pub const AND_INX: u8 = 0x21; // (bitwise AND with accumulator)
-pub const AND_INY: u8 = 0x31; // (bitwise AND with accumulator)
-pub const ASL: u8 = 0x0a; // (Arithmetic Shift Left)
+pub const BRK: u8 = 0x00; // (BReaK)
+pub const ORA_INX: u8 = 0x01; // (bitwise OR with Accumulator)
+pub const SLO_INX: u8 = 0x03; // SLO = ASL + ORA (Unofficial opcode)
+pub const ORA_ZP: u8 = 0x05; // (bitwise OR with Accumulator)
 pub const ASL_ZP: u8 = 0x06; // (Arithmetic Shift Left)
-pub const ASL_ZPX: u8 = 0x16; // (Arithmetic Shift Left)
+pub const SLO_ZP: u8 = 0x07; // SLO = ASL + ORA (Unofficial opcode)
+pub const PHP: u8 = 0x08; // (PusH Processor status)    
+pub const ORA_IMM: u8 = 0x09; // (bitwise OR with Accumulator)
+pub const ASL: u8 = 0x0a; // (Arithmetic Shift Left)
+pub const ORA_ABS: u8 = 0x0d; // (bitwise OR with Accumulator)
 pub const ASL_ABS: u8 = 0x0e; // (Arithmetic Shift Left)
+pub const SLO_ABS: u8 = 0x0f; // SLO = ASL + ORA (Unofficial opcode)
+pub const BPL: u8 = 0x10; // (Branch on PLus)          
+pub const ORA_INY: u8 = 0x11; // (bitwise OR with Accumulator)
+pub const SLO_INY: u8 = 0x13; // SLO = ASL + ORA (Unofficial opcode)
+pub const NOP_14: u8 = 0x14; // NOP (Unofficial opcode)
+pub const ORA_ZPX: u8 = 0x15; // (bitwise OR with Accumulator)
+pub const ASL_ZPX: u8 = 0x16; // (Arithmetic Shift Left)
+pub const SLO_ZPX: u8 = 0x17; // SLO = ASL + ORA (Unofficial opcode)
+pub const CLC: u8 = 0x18; // (CLear Carry)             
+pub const ORA_ABY: u8 = 0x19; // (bitwise OR with Accumulator)
+pub const SLO_ABY: u8 = 0x1b; // SLO = ASL + ORA (Unofficial opcode)
+pub const N1C_ABX: u8 = 0x1c; // NOP (Unofficial opcode)
+pub const ORA_ABX: u8 = 0x1d; // (bitwise OR with Accumulator)
 pub const ASL_ABX: u8 = 0x1e; // (Arithmetic Shift Left)
+pub const SLO_ABX: u8 = 0x1f; // SLO = ASL + ORA (Unofficial opcode)
+pub const JSR_ABS: u8 = 0x20; // (Jump to SubRoutine)
+pub const AND_INX: u8 = 0x21; // (bitwise AND with accumulator)
+pub const RLA_INX: u8 = 0x23; // RLA = ROL + AND (Unofficial opcode)
 pub const BIT_ZP: u8 = 0x24; // (test BITs)
+pub const AND_ZP: u8 = 0x25; // (bitwise AND with accumulator)
+pub const ROL_ZP: u8 = 0x26; // (ROtate Left)
+pub const RLA_ZP: u8 = 0x27; // RLA = ROL + AND (Unofficial opcode)
+pub const PLP: u8 = 0x28; // (PuLl Processor status)    
+pub const AND_IMM: u8 = 0x29; // (bitwise AND with accumulator)
+pub const ROL: u8 = 0x2a; // (ROtate Left)
 pub const BIT_ABS: u8 = 0x2c; // (test BITs)
-pub const BPL: u8 = 0x10; // (Branch on PLus)          
+pub const AND_ABS: u8 = 0x2d; // (bitwise AND with accumulator)
+pub const ROL_ABS: u8 = 0x2e; // (ROtate Left)
+pub const RLA_ABS: u8 = 0x2f; // RLA = ROL + AND (Unofficial opcode)
 pub const BMI: u8 = 0x30; // (Branch on MInus)         
-pub const BVC: u8 = 0x50; // (Branch on oVerflow Clear)
-pub const BVS: u8 = 0x70; // (Branch on oVerflow Set)  
-pub const BCC: u8 = 0x90; // (Branch on Carry Clear)   
-pub const BCS: u8 = 0xb0; // (Branch on Carry Set)     
-pub const BNE: u8 = 0xd0; // (Branch on Not Equal)     
-pub const BEQ: u8 = 0xf0; // (Branch on EQual)         
-pub const BRK: u8 = 0x00; // (BReaK)
-pub const CMP_IMM: u8 = 0xc9; // (CoMPare accumulator)
-pub const CMP_ZP: u8 = 0xc5; // (CoMPare accumulator)
-pub const CMP_ZPX: u8 = 0xd5; // (CoMPare accumulator)
-pub const CMP_ABS: u8 = 0xcd; // (CoMPare accumulator)
-pub const CMP_ABX: u8 = 0xdd; // (CoMPare accumulator)
-pub const CMP_ABY: u8 = 0xd9; // (CoMPare accumulator)
-pub const CMP_INX: u8 = 0xc1; // (CoMPare accumulator)
-pub const CMP_INY: u8 = 0xd1; // (CoMPare accumulator)
-pub const CPX_IMM: u8 = 0xe0; // (ComPare X register)
-pub const CPX_ZP: u8 = 0xe4; // (ComPare X register)
-pub const CPX_ABS: u8 = 0xec; // (ComPare X register)
-pub const CPY_IMM: u8 = 0xc0; // (ComPare Y register)
-pub const CPY_ZP: u8 = 0xc4; // (ComPare Y register)
-pub const CPY_ABS: u8 = 0xcc; // (ComPare Y register)
-pub const DEC_ZP: u8 = 0xc6; // (DECrement memory)
-pub const DEC_ZPX: u8 = 0xd6; // (DECrement memory)
-pub const DEC_ABS: u8 = 0xce; // (DECrement memory)
-pub const DEC_ABX: u8 = 0xde; // (DECrement memory)
-pub const EOR_IMM: u8 = 0x49; // (bitwise Exclusive OR)
+pub const AND_INY: u8 = 0x31; // (bitwise AND with accumulator)
+pub const RLA_INY: u8 = 0x33; // RLA = ROL + AND (Unofficial opcode)
+pub const NOP_34: u8 = 0x34; // NOP (Unofficial opcode)
+pub const AND_ZPX: u8 = 0x35; // (bitwise AND with accumulator)
+pub const ROL_ZPX: u8 = 0x36; // (ROtate Left)
+pub const RLA_ZPX: u8 = 0x37; // RLA = ROL + AND (Unofficial opcode)
+pub const SEC: u8 = 0x38; // (SEt Carry)               
+pub const AND_ABY: u8 = 0x39; // (bitwise AND with accumulator)
+pub const RLA_ABY: u8 = 0x3b; // RLA = ROL + AND (Unofficial opcode)
+pub const N3C_ABX: u8 = 0x3c; // NOP (Unofficial opcode)
+pub const AND_ABX: u8 = 0x3d; // (bitwise AND with accumulator)
+pub const ROL_ABX: u8 = 0x3e; // (ROtate Left)
+pub const RLA_ABX: u8 = 0x3f; // RLA = ROL + AND (Unofficial opcode)
+pub const RTI: u8 = 0x40; // (ReTurn from Interrupt)
+pub const EOR_INX: u8 = 0x41; // (bitwise Exclusive OR)
+pub const SRE_INX: u8 = 0x43; // SRE = LSR + EOR (Unofficial opcode)
 pub const EOR_ZP: u8 = 0x45; // (bitwise Exclusive OR)
-pub const EOR_ZPX: u8 = 0x55; // (bitwise Exclusive OR)
+pub const LSR_ZP: u8 = 0x46; // (Logical Shift Right)
+pub const SRE_ZP: u8 = 0x47; // SRE = LSR + EOR (Unofficial opcode)
+pub const PHA: u8 = 0x48; // (PusH Accumulator)         
+pub const EOR_IMM: u8 = 0x49; // (bitwise Exclusive OR)
+pub const LSR: u8 = 0x4a; // (Logical Shift Right)
+pub const JMP_ABS: u8 = 0x4c; // (JuMP)
 pub const EOR_ABS: u8 = 0x4d; // (bitwise Exclusive OR)
-pub const EOR_ABX: u8 = 0x5d; // (bitwise Exclusive OR)
-pub const EOR_ABY: u8 = 0x59; // (bitwise Exclusive OR)
-pub const EOR_INX: u8 = 0x41; // (bitwise Exclusive OR)
+pub const LSR_ABS: u8 = 0x4e; // (Logical Shift Right)
+pub const SRE_ABS: u8 = 0x4f; // SRE = LSR + EOR (Unofficial opcode))
+pub const BVC: u8 = 0x50; // (Branch on oVerflow Clear)
 pub const EOR_INY: u8 = 0x51; // (bitwise Exclusive OR)
-pub const CLC: u8 = 0x18; // (CLear Carry)             
-pub const SEC: u8 = 0x38; // (SEt Carry)               
-pub const CLI: u8 = 0x58; // (CLear Interrupt)         
-pub const SEI: u8 = 0x78; // (SEt Interrupt)           
-pub const CLV: u8 = 0xb8; // (CLear oVerflow)          
-pub const CLD: u8 = 0xd8; // (CLear Decimal)           
-pub const SED: u8 = 0xf8; // (SEt Decimal)             
-pub const INC_ZP: u8 = 0xe6; // (INCrement memory)
-pub const INC_ZPX: u8 = 0xf6; // (INCrement memory)
-pub const INC_ABS: u8 = 0xee; // (INCrement memory)
-pub const INC_ABX: u8 = 0xfe; // (INCrement memory)
-pub const JMP_ABS: u8 = 0x4c; // (JuMP)
-pub const JMP_IND: u8 = 0x6c; // (JuMP)
-pub const JSR_ABS: u8 = 0x20; // (Jump to SubRoutine)
-pub const LDA_IMM: u8 = 0xa9; // (LoaD Accumulator)
-pub const LDA_ZP: u8 = 0xa5; // (LoaD Accumulator)
-pub const LDA_ZPX: u8 = 0xb5; // (LoaD Accumulator)
-pub const LDA_ABS: u8 = 0xad; // (LoaD Accumulator)
-pub const LDA_ABX: u8 = 0xbd; // (LoaD Accumulator)
-pub const LDA_ABY: u8 = 0xb9; // (LoaD Accumulator)
-pub const LDA_INX: u8 = 0xa1; // (LoaD Accumulator)
-pub const LDA_INY: u8 = 0xb1; // (LoaD Accumulator)
-pub const LDX_IMM: u8 = 0xa2; // (LoaD X register)
-pub const LDX_ZP: u8 = 0xa6; // (LoaD X register)
-pub const LDX_ZPY: u8 = 0xb6; // (LoaD X register)
-pub const LDX_ABS: u8 = 0xae; // (LoaD X register)
-pub const LDX_ABY: u8 = 0xbe; // (LoaD X register)
-pub const LDY_IMM: u8 = 0xa0; // (LoaD Y register)
-pub const LDY_ZP: u8 = 0xa4; // (LoaD Y register)
-pub const LDY_ZPX: u8 = 0xb4; // (LoaD Y register)
-pub const LDY_ABS: u8 = 0xac; // (LoaD Y register)
-pub const LDY_ABX: u8 = 0xbc; // (LoaD Y register)
-pub const LSR: u8 = 0x4a; // (Logical Shift Right)
-pub const LSR_ZP: u8 = 0x46; // (Logical Shift Right)
+pub const SRE_INY: u8 = 0x53; // SRE = LSR + EOR (Unofficial opcode)
+pub const NOP_54: u8 = 0x54; // NOP (Unofficial opcode)
+pub const EOR_ZPX: u8 = 0x55; // (bitwise Exclusive OR)
 pub const LSR_ZPX: u8 = 0x56; // (Logical Shift Right)
-pub const LSR_ABS: u8 = 0x4e; // (Logical Shift Right)
+pub const SRE_ZPX: u8 = 0x57; // SRE = LSR + EOR (Unofficial opcode)
+pub const CLI: u8 = 0x58; // (CLear Interrupt)         
+pub const EOR_ABY: u8 = 0x59; // (bitwise Exclusive OR)
+pub const SRE_ABY: u8 = 0x5b; // SRE = LSR + EOR (Unofficial opcode)
+pub const N5C_ABX: u8 = 0x5c; // NOP (Unofficial opcode)
+pub const EOR_ABX: u8 = 0x5d; // (bitwise Exclusive OR)
 pub const LSR_ABX: u8 = 0x5e; // (Logical Shift Right)
-pub const NOP: u8 = 0xea; // (No OPeration)
-pub const ORA_IMM: u8 = 0x09; // (bitwise OR with Accumulator)
-pub const ORA_ZP: u8 = 0x05; // (bitwise OR with Accumulator)
-pub const ORA_ZPX: u8 = 0x15; // (bitwise OR with Accumulator)
-pub const ORA_ABS: u8 = 0x0d; // (bitwise OR with Accumulator)
-pub const ORA_ABX: u8 = 0x1d; // (bitwise OR with Accumulator)
-pub const ORA_ABY: u8 = 0x19; // (bitwise OR with Accumulator)
-pub const ORA_INX: u8 = 0x01; // (bitwise OR with Accumulator)
-pub const ORA_INY: u8 = 0x11; // (bitwise OR with Accumulator)
-pub const TAX: u8 = 0xaa; // (Transfer A to X)   
-pub const TXA: u8 = 0x8a; // (Transfer X to A)   
-pub const DEX: u8 = 0xca; // (DEcrement X)       
-pub const INX: u8 = 0xe8; // (INcrement X)       
-pub const TAY: u8 = 0xa8; // (Transfer A to Y)   
-pub const TYA: u8 = 0x98; // (Transfer Y to A)   
-pub const DEY: u8 = 0x88; // (DEcrement Y)       
-pub const INY: u8 = 0xc8; // (INcrement Y)       
-pub const ROL: u8 = 0x2a; // (ROtate Left)
-pub const ROL_ZP: u8 = 0x26; // (ROtate Left)
-pub const ROL_ZPX: u8 = 0x36; // (ROtate Left)
-pub const ROL_ABS: u8 = 0x2e; // (ROtate Left)
-pub const ROL_ABX: u8 = 0x3e; // (ROtate Left)
-pub const ROR: u8 = 0x6a; // (ROtate Right)
+pub const SRE_ABX: u8 = 0x5f; // SRE = LSR + EOR (Unofficial opcode)
+pub const RTS: u8 = 0x60; // (ReTurn from Subroutine)
+pub const ADC_INX: u8 = 0x61; // (ADd with Carry)
+pub const RRA_INX: u8 = 0x63; // RRA = ROR + ADC (Unofficial opcode)
+pub const ADC_ZP: u8 = 0x65; // (ADd with Carry)
 pub const ROR_ZP: u8 = 0x66; // (ROtate Right)
-pub const ROR_ZPX: u8 = 0x76; // (ROtate Right)
+pub const RRA_ZP: u8 = 0x67; // RRA = ROR + ADC (Unofficial opcode)
+pub const PLA: u8 = 0x68; // (PuLl Accumulator)         
+pub const ADC_IMM: u8 = 0x69; // (ADd with Carry)
+pub const ROR: u8 = 0x6a; // (ROtate Right)
+pub const JMP_IND: u8 = 0x6c; // (JuMP)
+pub const ADC_ABS: u8 = 0x6d; // (ADd with Carry)
 pub const ROR_ABS: u8 = 0x6e; // (ROtate Right)
+pub const RRA_ABS: u8 = 0x6f; // RRA = ROR + ADC (Unofficial opcode)
+pub const BVS: u8 = 0x70; // (Branch on oVerflow Set)  
+pub const ADC_INY: u8 = 0x71; // (ADd with Carry)
+pub const RRA_INY: u8 = 0x73; // RRA = ROR + ADC (Unofficial opcode)
+pub const NOP_74: u8 = 0x74; // NOP (Unofficial opcode)
+pub const ADC_ZPX: u8 = 0x75; // (ADd with Carry)
+pub const ROR_ZPX: u8 = 0x76; // (ROtate Right)
+pub const RRA_ZPX: u8 = 0x77; // RRA = ROR + ADC (Unofficial opcode)
+pub const SEI: u8 = 0x78; // (SEt Interrupt)           
+pub const ADC_ABY: u8 = 0x79; // (ADd with Carry)
+pub const RRA_ABY: u8 = 0x7b; // RRA = ROR + ADC (Unofficial opcode)
+pub const N7C_ABX: u8 = 0x7c; // NOP (Unofficial opcode)
+pub const ADC_ABX: u8 = 0x7d; // (ADd with Carry)
 pub const ROR_ABX: u8 = 0x7e; // (ROtate Right)
-pub const RTI: u8 = 0x40; // (ReTurn from Interrupt)
-pub const RTS: u8 = 0x60; // (ReTurn from Subroutine)
-pub const SBC_IMM: u8 = 0xe9; // (SuBtract with Carry)
-pub const SBC_ZP: u8 = 0xe5; // (SuBtract with Carry)
-pub const SBC_ZPX: u8 = 0xf5; // (SuBtract with Carry)
-pub const SBC_ABS: u8 = 0xed; // (SuBtract with Carry)
-pub const SBC_ABX: u8 = 0xfd; // (SuBtract with Carry)
-pub const SBC_ABY: u8 = 0xf9; // (SuBtract with Carry)
-pub const SBC_INX: u8 = 0xe1; // (SuBtract with Carry)
-pub const SBC_INY: u8 = 0xf1; // (SuBtract with Carry)
-pub const STA_ZP: u8 = 0x85; // (STore Accumulator)
-pub const STA_ZPX: u8 = 0x95; // (STore Accumulator)
-pub const STA_ABS: u8 = 0x8d; // (STore Accumulator)
-pub const STA_ABX: u8 = 0x9d; // (STore Accumulator)
-pub const STA_ABY: u8 = 0x99; // (STore Accumulator)
+pub const RRA_ABX: u8 = 0x7f; // RRA = ROR + ADC (Unofficial opcode)
 pub const STA_INX: u8 = 0x81; // (STore Accumulator)
-pub const STA_INY: u8 = 0x91; // (STore Accumulator)
-pub const TXS: u8 = 0x9a; // (Transfer X to Stack ptr)  
-pub const TSX: u8 = 0xba; // (Transfer Stack ptr to X)  
-pub const PHA: u8 = 0x48; // (PusH Accumulator)         
-pub const PLA: u8 = 0x68; // (PuLl Accumulator)         
-pub const PHP: u8 = 0x08; // (PusH Processor status)    
-pub const PLP: u8 = 0x28; // (PuLl Processor status)    
+pub const SAX_INX: u8 = 0x83; // SAX = Store A&X (Unofficial opcode)
+pub const STY_ZP: u8 = 0x84; // (STore Y register)
+pub const STA_ZP: u8 = 0x85; // (STore Accumulator)
 pub const STX_ZP: u8 = 0x86; // (STore X register)
-pub const STX_ZPY: u8 = 0x96; // (STore X register)
+pub const SAX_ZP: u8 = 0x87; // SAX = Store A&X (Unofficial opcode)
+pub const DEY: u8 = 0x88; // (DEcrement Y)       
+pub const TXA: u8 = 0x8a; // (Transfer X to A)   
+pub const STY_ABS: u8 = 0x8c; // (STore Y register)
+pub const STA_ABS: u8 = 0x8d; // (STore Accumulator)
 pub const STX_ABS: u8 = 0x8e; // (STore X register)
-pub const STY_ZP: u8 = 0x84; // (STore Y register)
+pub const SAX_ABS: u8 = 0x8f; // SAX = Store A&X (Unofficial opcode)
+pub const BCC: u8 = 0x90; // (Branch on Carry Clear)   
+pub const STA_INY: u8 = 0x91; // (STore Accumulator)
 pub const STY_ZPX: u8 = 0x94; // (STore Y register)
-pub const STY_ABS: u8 = 0x8c; // (STore Y register)
+pub const STA_ZPX: u8 = 0x95; // (STore Accumulator)
+pub const STX_ZPY: u8 = 0x96; // (STore X register)
+pub const SAX_ZPY: u8 = 0x97; // SAX = Store A&X (Unofficial opcode)
+pub const TYA: u8 = 0x98; // (Transfer Y to A)   
+pub const STA_ABY: u8 = 0x99; // (STore Accumulator)
+pub const TXS: u8 = 0x9a; // (Transfer X to Stack ptr)  
+pub const STA_ABX: u8 = 0x9d; // (STore Accumulator)
+pub const LDY_IMM: u8 = 0xa0; // (LoaD Y register)
+pub const LDA_INX: u8 = 0xa1; // (LoaD Accumulator)
+pub const LDX_IMM: u8 = 0xa2; // (LoaD X register)
 pub const LAX_INX: u8 = 0xa3; // LAX = LDA + LDX (Unofficial opcode)
+pub const LDY_ZP: u8 = 0xa4; // (LoaD Y register)
+pub const LDA_ZP: u8 = 0xa5; // (LoaD Accumulator)
+pub const LDX_ZP: u8 = 0xa6; // (LoaD X register)
 pub const LAX_ZP: u8 = 0xa7; // LAX = LDA + LDX (Unofficial opcode)
+pub const TAY: u8 = 0xa8; // (Transfer A to Y)   
+pub const LDA_IMM: u8 = 0xa9; // (LoaD Accumulator)
+pub const TAX: u8 = 0xaa; // (Transfer A to X)   
+pub const LDY_ABS: u8 = 0xac; // (LoaD Y register)
+pub const LDA_ABS: u8 = 0xad; // (LoaD Accumulator)
+pub const LDX_ABS: u8 = 0xae; // (LoaD X register)
 pub const LAX_ABS: u8 = 0xaf; // LAX = LDA + LDX (Unofficial opcode)
+pub const BCS: u8 = 0xb0; // (Branch on Carry Set)     
+pub const LDA_INY: u8 = 0xb1; // (LoaD Accumulator)
 pub const LAX_INY: u8 = 0xb3; // LAX = LDA + LDX (Unofficial opcode)
+pub const LDY_ZPX: u8 = 0xb4; // (LoaD Y register)
+pub const LDA_ZPX: u8 = 0xb5; // (LoaD Accumulator)
+pub const LDX_ZPY: u8 = 0xb6; // (LoaD X register)
 pub const LAX_ZPY: u8 = 0xb7; // LAX = LDA + LDX (Unofficial opcode)
+pub const CLV: u8 = 0xb8; // (CLear oVerflow)          
+pub const LDA_ABY: u8 = 0xb9; // (LoaD Accumulator)
+pub const TSX: u8 = 0xba; // (Transfer Stack ptr to X)  
+pub const LDY_ABX: u8 = 0xbc; // (LoaD Y register)
+pub const LDA_ABX: u8 = 0xbd; // (LoaD Accumulator)
+pub const LDX_ABY: u8 = 0xbe; // (LoaD X register)
 pub const LAX_ABY: u8 = 0xbf; // LAX = LDA + LDX (Unofficial opcode)
-pub const SAX_INX: u8 = 0x83; // SAX = Store A&X (Unofficial opcode)
-pub const SAX_ZP: u8 = 0x87; // SAX = Store A&X (Unofficial opcode)
-pub const SAX_ABS: u8 = 0x8f; // SAX = Store A&X (Unofficial opcode)
-pub const SAX_ZPY: u8 = 0x97; // SAX = Store A&X (Unofficial opcode)
-pub const SNC_IMM: u8 = 0xeb; // SNC = SBC + NOP (Unofficial opcode)
+pub const CPY_IMM: u8 = 0xc0; // (ComPare Y register)
+pub const CMP_INX: u8 = 0xc1; // (CoMPare accumulator)
 pub const DCP_INX: u8 = 0xc3; // DCP = DEC + CMP (Unofficial opcode)
+pub const CPY_ZP: u8 = 0xc4; // (ComPare Y register)
+pub const CMP_ZP: u8 = 0xc5; // (CoMPare accumulator)
+pub const DEC_ZP: u8 = 0xc6; // (DECrement memory)
 pub const DCP_ZP: u8 = 0xc7; // DCP = DEC + CMP (Unofficial opcode)
+pub const INY: u8 = 0xc8; // (INcrement Y)       
+pub const CMP_IMM: u8 = 0xc9; // (CoMPare accumulator)
+pub const DEX: u8 = 0xca; // (DEcrement X)       
+pub const CPY_ABS: u8 = 0xcc; // (ComPare Y register)
+pub const CMP_ABS: u8 = 0xcd; // (CoMPare accumulator)
+pub const DEC_ABS: u8 = 0xce; // (DECrement memory)
 pub const DCP_ABS: u8 = 0xcf; // DCP = DEC + CMP (Unofficial opcode)
+pub const BNE: u8 = 0xd0; // (Branch on Not Equal)     
+pub const CMP_INY: u8 = 0xd1; // (CoMPare accumulator)
 pub const DCP_INY: u8 = 0xd3; // DCP = DEC + CMP (Unofficial opcode)
+pub const NOP_D4: u8 = 0xd4; // NOP (Unofficial opcode)
+pub const CMP_ZPX: u8 = 0xd5; // (CoMPare accumulator)
+pub const DEC_ZPX: u8 = 0xd6; // (DECrement memory)
 pub const DCP_ZPX: u8 = 0xd7; // DCP = DEC + CMP (Unofficial opcode)
+pub const CLD: u8 = 0xd8; // (CLear Decimal)           
+pub const CMP_ABY: u8 = 0xd9; // (CoMPare accumulator)
 pub const DCP_ABY: u8 = 0xdb; // DCP = DEC + CMP (Unofficial opcode)
+pub const NDC_ABX: u8 = 0xdc; // NOP (Unofficial opcode)
+pub const CMP_ABX: u8 = 0xdd; // (CoMPare accumulator)
+pub const DEC_ABX: u8 = 0xde; // (DECrement memory)
 pub const DCP_ABX: u8 = 0xdf; // DCP = DEC + CMP (Unofficial opcode)
+pub const CPX_IMM: u8 = 0xe0; // (ComPare X register)
+pub const SBC_INX: u8 = 0xe1; // (SuBtract with Carry)
 pub const ISB_INX: u8 = 0xe3; // ISB = INC + SBC (Unofficial opcode)
+pub const CPX_ZP: u8 = 0xe4; // (ComPare X register)
+pub const SBC_ZP: u8 = 0xe5; // (SuBtract with Carry)
+pub const INC_ZP: u8 = 0xe6; // (INCrement memory)
 pub const ISB_ZP: u8 = 0xe7; // ISB = INC + SBC (Unofficial opcode)
+pub const INX: u8 = 0xe8; // (INcrement X)       
+pub const SBC_IMM: u8 = 0xe9; // (SuBtract with Carry)
+pub const NOP: u8 = 0xea; // (No OPeration)
+pub const SNC_IMM: u8 = 0xeb; // SNC = SBC + NOP (Unofficial opcode)
+pub const CPX_ABS: u8 = 0xec; // (ComPare X register)
+pub const SBC_ABS: u8 = 0xed; // (SuBtract with Carry)
+pub const INC_ABS: u8 = 0xee; // (INCrement memory)
 pub const ISB_ABS: u8 = 0xef; // ISB = INC + SBC (Unofficial opcode)
+pub const BEQ: u8 = 0xf0; // (Branch on EQual)         
+pub const SBC_INY: u8 = 0xf1; // (SuBtract with Carry)
 pub const ISB_INY: u8 = 0xf3; // ISB = INC + SBC (Unofficial opcode)
+pub const NOP_F4: u8 = 0xf4; // NOP (Unofficial opcode)
+pub const SBC_ZPX: u8 = 0xf5; // (SuBtract with Carry)
+pub const INC_ZPX: u8 = 0xf6; // (INCrement memory)
 pub const ISB_ZPX: u8 = 0xf7; // ISB = INC + SBC (Unofficial opcode)
+pub const SED: u8 = 0xf8; // (SEt Decimal)             
+pub const SBC_ABY: u8 = 0xf9; // (SuBtract with Carry)
 pub const ISB_ABY: u8 = 0xfb; // ISB = INC + SBC (Unofficial opcode)
-pub const ISB_ABX: u8 = 0xff; // ISB = INC + SBC (Unofficial opcode)
-pub const SLO_INX: u8 = 0x03; // SLO = ASL + ORA (Unofficial opcode)
-pub const SLO_ZP: u8 = 0x07; // SLO = ASL + ORA (Unofficial opcode)
-pub const SLO_ABS: u8 = 0x0f; // SLO = ASL + ORA (Unofficial opcode)
-pub const SLO_INY: u8 = 0x13; // SLO = ASL + ORA (Unofficial opcode)
-pub const SLO_ZPX: u8 = 0x17; // SLO = ASL + ORA (Unofficial opcode)
-pub const SLO_ABY: u8 = 0x1b; // SLO = ASL + ORA (Unofficial opcode)
-pub const SLO_ABX: u8 = 0x1f; // SLO = ASL + ORA (Unofficial opcode)
-pub const RLA_INX: u8 = 0x23; // RLA = ROL + AND (Unofficial opcode)
-pub const RLA_ZP: u8 = 0x27; // RLA = ROL + AND (Unofficial opcode)
-pub const RLA_ABS: u8 = 0x2f; // RLA = ROL + AND (Unofficial opcode)
-pub const RLA_INY: u8 = 0x33; // RLA = ROL + AND (Unofficial opcode)
-pub const RLA_ZPX: u8 = 0x37; // RLA = ROL + AND (Unofficial opcode)
-pub const RLA_ABY: u8 = 0x3b; // RLA = ROL + AND (Unofficial opcode)
-pub const RLA_ABX: u8 = 0x3f; // RLA = ROL + AND (Unofficial opcode)
-pub const SRE_INX: u8 = 0x43; // SRE = LSR + EOR (Unofficial opcode)
-pub const SRE_ZP: u8 = 0x47; // SRE = LSR + EOR (Unofficial opcode)
-pub const SRE_ABS: u8 = 0x4f; // SRE = LSR + EOR (Unofficial opcode))
-pub const SRE_INY: u8 = 0x53; // SRE = LSR + EOR (Unofficial opcode)
-pub const SRE_ZPX: u8 = 0x57; // SRE = LSR + EOR (Unofficial opcode)
-pub const SRE_ABY: u8 = 0x5b; // SRE = LSR + EOR (Unofficial opcode)
-pub const SRE_ABX: u8 = 0x5f; // SRE = LSR + EOR (Unofficial opcode)
-pub const RRA_INX: u8 = 0x63; // RRA = ROR + ADC (Unofficial opcode)
-pub const RRA_ZP: u8 = 0x67; // RRA = ROR + ADC (Unofficial opcode)
-pub const RRA_ABS: u8 = 0x6f; // RRA = ROR + ADC (Unofficial opcode)
-pub const RRA_INY: u8 = 0x73; // RRA = ROR + ADC (Unofficial opcode)
-pub const RRA_ZPX: u8 = 0x77; // RRA = ROR + ADC (Unofficial opcode)
-pub const RRA_ABY: u8 = 0x7b; // RRA = ROR + ADC (Unofficial opcode)
-pub const RRA_ABX: u8 = 0x7f; // RRA = ROR + ADC (Unofficial opcode)
-pub const N1C_ABX: u8 = 0x1c; // NOP (Unofficial opcode)
-pub const N3C_ABX: u8 = 0x3c; // NOP (Unofficial opcode)
-pub const N5C_ABX: u8 = 0x5c; // NOP (Unofficial opcode)
-pub const N7C_ABX: u8 = 0x7c; // NOP (Unofficial opcode)
-pub const NDC_ABX: u8 = 0xdc; // NOP (Unofficial opcode)
 pub const NFC_ABX: u8 = 0xfc; // NOP (Unofficial opcode)
-pub const NOP_14: u8 = 0x14; // NOP (Unofficial opcode)
-pub const NOP_34: u8 = 0x34; // NOP (Unofficial opcode)
-pub const NOP_54: u8 = 0x54; // NOP (Unofficial opcode)
-pub const NOP_74: u8 = 0x74; // NOP (Unofficial opcode)
-pub const NOP_D4: u8 = 0xd4; // NOP (Unofficial opcode)
-pub const NOP_F4: u8 = 0xf4; // NOP (Unofficial opcode)
+pub const SBC_ABX: u8 = 0xfd; // (SuBtract with Carry)
+pub const INC_ABX: u8 = 0xfe; // (INCrement memory)
+pub const ISB_ABX: u8 = 0xff; // ISB = INC + SBC (Unofficial opcode)
 
-pub struct Opcode {
-    name: &'static str,
-    size: u16,
-    #[allow(dead_code)]
-    cycles: u8,
-    mode: usize,
-    page_boundary_penalty: bool
-}
+pub struct Lookup;
 
-pub struct Lookup {
-    opcodes: [&'static Opcode; 256],
-}
+static NAMES_BLOB: &str = concat!(
+    "BRK", "ORA_INX", "NOP", "SLO_INX", "ORA_ZP", "ASL_ZP", "SLO_ZP", "PHP",
+    "ORA_IMM", "ASL", "ORA_ABS", "ASL_ABS", "SLO_ABS", "BPL", "ORA_INY", "SLO_INY",
+    "NOP_14", "ORA_ZPX", "ASL_ZPX", "SLO_ZPX", "CLC", "ORA_ABY", "SLO_ABY", "N1C_ABX",
+    "ORA_ABX", "ASL_ABX", "SLO_ABX", "JSR_ABS", "AND_INX", "RLA_INX", "BIT_ZP", "AND_ZP",
+    "ROL_ZP", "RLA_ZP", "PLP", "AND_IMM", "ROL", "BIT_ABS", "AND_ABS", "ROL_ABS",
+    "RLA_ABS", "BMI", "AND_INY", "RLA_INY", "NOP_34", "AND_ZPX", "ROL_ZPX", "RLA_ZPX",
+    "SEC", "AND_ABY", "RLA_ABY", "N3C_ABX", "AND_ABX", "ROL_ABX", "RLA_ABX", "RTI",
+    "EOR_INX", "SRE_INX", "EOR_ZP", "LSR_ZP", "SRE_ZP", "PHA", "EOR_IMM", "LSR",
+    "JMP_ABS", "EOR_ABS", "LSR_ABS", "SRE_ABS", "BVC", "EOR_INY", "SRE_INY", "NOP_54",
+    "EOR_ZPX", "LSR_ZPX", "SRE_ZPX", "CLI", "EOR_ABY", "SRE_ABY", "N5C_ABX", "EOR_ABX",
+    "LSR_ABX", "SRE_ABX", "RTS", "ADC_INX", "RRA_INX", "ADC_ZP", "ROR_ZP", "RRA_ZP",
+    "PLA", "ADC_IMM", "ROR", "JMP_IND", "ADC_ABS", "ROR_ABS", "RRA_ABS", "BVS",
+    "ADC_INY", "RRA_INY", "NOP_74", "ADC_ZPX", "ROR_ZPX", "RRA_ZPX", "SEI", "ADC_ABY",
+    "RRA_ABY", "N7C_ABX", "ADC_ABX", "ROR_ABX", "RRA_ABX", "STA_INX", "SAX_INX", "STY_ZP",
+    "STA_ZP", "STX_ZP", "SAX_ZP", "DEY", "TXA", "STY_ABS", "STA_ABS", "STX_ABS",
+    "SAX_ABS", "BCC", "STA_INY", "STY_ZPX", "STA_ZPX", "STX_ZPY", "SAX_ZPY", "TYA",
+    "STA_ABY", "TXS", "STA_ABX", "LDY_IMM", "LDA_INX", "LDX_IMM", "LAX_INX", "LDY_ZP",
+    "LDA_ZP", "LDX_ZP", "LAX_ZP", "TAY", "LDA_IMM", "TAX", "LDY_ABS", "LDA_ABS",
+    "LDX_ABS", "LAX_ABS", "BCS", "LDA_INY", "LAX_INY", "LDY_ZPX", "LDA_ZPX", "LDX_ZPY",
+    "LAX_ZPY", "CLV", "LDA_ABY", "TSX", "LDY_ABX", "LDA_ABX", "LDX_ABY", "LAX_ABY",
+    "CPY_IMM", "CMP_INX", "DCP_INX", "CPY_ZP", "CMP_ZP", "DEC_ZP", "DCP_ZP", "INY",
+    "CMP_IMM", "DEX", "CPY_ABS", "CMP_ABS", "DEC_ABS", "DCP_ABS", "BNE", "CMP_INY",
+    "DCP_INY", "NOP_D4", "CMP_ZPX", "DEC_ZPX", "DCP_ZPX", "CLD", "CMP_ABY", "DCP_ABY",
+    "NDC_ABX", "CMP_ABX", "DEC_ABX", "DCP_ABX", "CPX_IMM", "SBC_INX", "ISB_INX", "CPX_ZP",
+    "SBC_ZP", "INC_ZP", "ISB_ZP", "INX", "SBC_IMM", "SNC_IMM", "CPX_ABS", "SBC_ABS",
+    "INC_ABS", "ISB_ABS", "BEQ", "SBC_INY", "ISB_INY", "NOP_F4", "SBC_ZPX", "INC_ZPX",
+    "ISB_ZPX", "SED", "SBC_ABY", "ISB_ABY", "NFC_ABX", "SBC_ABX", "INC_ABX", "ISB_ABX",
+);
+
+static NAME_SPANS: [(u16, u8); 256] = [
+    (0, 3), (3, 7), (10, 3), (13, 7), (10, 3), (20, 6), (26, 6), (32, 6), // 0x00
+    (38, 3), (41, 7), (48, 3), (10, 3), (10, 3), (51, 7), (58, 7), (65, 7), // 0x08
+    (72, 3), (75, 7), (10, 3), (82, 7), (89, 6), (95, 7), (102, 7), (109, 7), // 0x10
+    (116, 3), (119, 7), (10, 3), (126, 7), (133, 7), (140, 7), (147, 7), (154, 7), // 0x18
+    (161, 7), (168, 7), (10, 3), (175, 7), (182, 6), (188, 6), (194, 6), (200, 6), // 0x20
+    (206, 3), (209, 7), (216, 3), (10, 3), (219, 7), (226, 7), (233, 7), (240, 7), // 0x28
+    (247, 3), (250, 7), (10, 3), (257, 7), (264, 6), (270, 7), (277, 7), (284, 7), // 0x30
+    (291, 3), (294, 7), (10, 3), (301, 7), (308, 7), (315, 7), (322, 7), (329, 7), // 0x38
+    (336, 3), (339, 7), (10, 3), (346, 7), (10, 3), (353, 6), (359, 6), (365, 6), // 0x40
+    (371, 3), (374, 7), (381, 3), (10, 3), (384, 7), (391, 7), (398, 7), (405, 7), // 0x48
+    (412, 3), (415, 7), (10, 3), (422, 7), (429, 6), (435, 7), (442, 7), (449, 7), // 0x50
+    (456, 3), (459, 7), (10, 3), (466, 7), (473, 7), (480, 7), (487, 7), (494, 7), // 0x58
+    (501, 3), (504, 7), (10, 3), (511, 7), (10, 3), (518, 6), (524, 6), (530, 6), // 0x60
+    (536, 3), (539, 7), (546, 3), (10, 3), (549, 7), (556, 7), (563, 7), (570, 7), // 0x68
+    (577, 3), (580, 7), (10, 3), (587, 7), (594, 6), (600, 7), (607, 7), (614, 7), // 0x70
+    (621, 3), (624, 7), (10, 3), (631, 7), (638, 7), (645, 7), (652, 7), (659, 7), // 0x78
+    (10, 3), (666, 7), (10, 3), (673, 7), (680, 6), (686, 6), (692, 6), (698, 6), // 0x80
+    (704, 3), (10, 3), (707, 3), (10, 3), (710, 7), (717, 7), (724, 7), (731, 7), // 0x88
+    (738, 3), (741, 7), (10, 3), (10, 3), (748, 7), (755, 7), (762, 7), (769, 7), // 0x90
+    (776, 3), (779, 7), (786, 3), (10, 3), (10, 3), (789, 7), (10, 3), (10, 3), // 0x98
+    (796, 7), (803, 7), (810, 7), (817, 7), (824, 6), (830, 6), (836, 6), (842, 6), // 0xa0
+    (848, 3), (851, 7), (858, 3), (10, 3), (861, 7), (868, 7), (875, 7), (882, 7), // 0xa8
+    (889, 3), (892, 7), (10, 3), (899, 7), (906, 7), (913, 7), (920, 7), (927, 7), // 0xb0
+    (934, 3), (937, 7), (944, 3), (10, 3), (947, 7), (954, 7), (961, 7), (968, 7), // 0xb8
+    (975, 7), (982, 7), (10, 3), (989, 7), (996, 6), (1002, 6), (1008, 6), (1014, 6), // 0xc0
+    (1020, 3), (1023, 7), (1030, 3), (10, 3), (1033, 7), (1040, 7), (1047, 7), (1054, 7), // 0xc8
+    (1061, 3), (1064, 7), (10, 3), (1071, 7), (1078, 6), (1084, 7), (1091, 7), (1098, 7), // 0xd0
+    (1105, 3), (1108, 7), (10, 3), (1115, 7), (1122, 7), (1129, 7), (1136, 7), (1143, 7), // 0xd8
+    (1150, 7), (1157, 7), (10, 3), (1164, 7), (1171, 6), (1177, 6), (1183, 6), (1189, 6), // 0xe0
+    (1195, 3), (1198, 7), (10, 3), (1205, 7), (1212, 7), (1219, 7), (1226, 7), (1233, 7), // 0xe8
+    (1240, 3), (1243, 7), (10, 3), (1250, 7), (1257, 6), (1263, 7), (1270, 7), (1277, 7), // 0xf0
+    (1284, 3), (1287, 7), (10, 3), (1294, 7), (1301, 7), (1308, 7), (1315, 7), (1322, 7), // 0xf8
+];
+
+static SIZES: [u16; 256] = [
+    1, 2, 1, 2, 2, 2, 2, 2, // 0x00
+    1, 2, 1, 1, 3, 3, 3, 3, // 0x08
+    2, 2, 1, 2, 2, 2, 2, 2, // 0x10
+    1, 3, 1, 3, 3, 3, 3, 3, // 0x18
+    3, 2, 1, 2, 2, 2, 2, 2, // 0x20
+    1, 2, 1, 1, 3, 3, 3, 3, // 0x28
+    2, 2, 1, 2, 2, 2, 2, 2, // 0x30
+    1, 3, 1, 3, 3, 3, 3, 3, // 0x38
+    1, 2, 1, 2, 2, 2, 2, 2, // 0x40
+    1, 2, 1, 1, 3, 3, 3, 3, // 0x48
+    2, 2, 1, 2, 2, 2, 2, 2, // 0x50
+    1, 3, 1, 3, 3, 3, 3, 3, // 0x58
+    1, 2, 1, 2, 2, 2, 2, 2, // 0x60
+    1, 2, 1, 1, 3, 3, 3, 3, // 0x68
+    2, 2, 1, 2, 2, 2, 2, 2, // 0x70
+    1, 3, 1, 3, 3, 3, 3, 3, // 0x78
+    2, 2, 1, 2, 2, 2, 2, 2, // 0x80
+    1, 1, 1, 1, 3, 3, 3, 3, // 0x88
+    2, 2, 1, 1, 2, 2, 2, 2, // 0x90
+    1, 3, 1, 1, 3, 3, 1, 1, // 0x98
+    2, 2, 2, 2, 2, 2, 2, 2, // 0xa0
+    1, 2, 1, 1, 3, 3, 3, 3, // 0xa8
+    2, 2, 1, 2, 2, 2, 2, 2, // 0xb0
+    1, 3, 1, 1, 3, 3, 3, 3, // 0xb8
+    2, 2, 1, 2, 2, 2, 2, 2, // 0xc0
+    1, 2, 1, 1, 3, 3, 3, 3, // 0xc8
+    2, 2, 1, 2, 2, 2, 2, 2, // 0xd0
+    1, 3, 1, 3, 3, 3, 3, 3, // 0xd8
+    2, 2, 1, 2, 2, 2, 2, 2, // 0xe0
+    1, 2, 1, 2, 3, 3, 3, 3, // 0xe8
+    2, 2, 1, 2, 2, 2, 2, 2, // 0xf0
+    1, 3, 1, 3, 3, 3, 3, 3, // 0xf8
+];
+
+static CYCLES: [u8; 256] = [
+    7, 6, 2, 8, 3, 3, 5, 5, // 0x00
+    3, 2, 2, 2, 4, 4, 6, 6, // 0x08
+    2, 5, 2, 7, 4, 4, 6, 6, // 0x10
+    2, 4, 2, 6, 4, 4, 7, 6, // 0x18
+    6, 6, 2, 8, 3, 3, 5, 5, // 0x20
+    4, 2, 2, 2, 4, 4, 6, 6, // 0x28
+    2, 5, 2, 7, 4, 4, 6, 6, // 0x30
+    2, 4, 2, 6, 4, 4, 7, 6, // 0x38
+    6, 6, 2, 8, 3, 3, 5, 5, // 0x40
+    3, 2, 2, 2, 3, 4, 6, 6, // 0x48
+    2, 5, 2, 7, 4, 4, 6, 6, // 0x50
+    2, 4, 2, 6, 4, 4, 7, 6, // 0x58
+    6, 6, 2, 8, 3, 3, 5, 5, // 0x60
+    4, 2, 2, 2, 5, 4, 6, 6, // 0x68
+    2, 5, 2, 7, 4, 4, 6, 6, // 0x70
+    2, 4, 2, 6, 4, 4, 7, 6, // 0x78
+    2, 6, 2, 6, 3, 3, 3, 3, // 0x80
+    2, 2, 2, 2, 4, 4, 4, 4, // 0x88
+    2, 6, 2, 2, 4, 4, 4, 4, // 0x90
+    2, 5, 2, 2, 4, 5, 2, 2, // 0x98
+    2, 6, 2, 6, 3, 3, 3, 3, // 0xa0
+    2, 2, 2, 2, 4, 4, 4, 4, // 0xa8
+    2, 5, 2, 5, 4, 4, 4, 4, // 0xb0
+    2, 4, 2, 2, 4, 4, 4, 4, // 0xb8
+    2, 6, 2, 8, 3, 3, 5, 5, // 0xc0
+    2, 2, 2, 2, 4, 4, 6, 6, // 0xc8
+    2, 5, 2, 7, 4, 4, 6, 6, // 0xd0
+    2, 4, 2, 6, 4, 4, 7, 6, // 0xd8
+    2, 6, 2, 8, 3, 3, 5, 5, // 0xe0
+    2, 2, 2, 2, 4, 4, 6, 6, // 0xe8
+    2, 5, 2, 7, 4, 4, 6, 6, // 0xf0
+    2, 4, 2, 6, 4, 4, 7, 6, // 0xf8
+];
+
+static MODES: [usize; 256] = [
+    ADDR_MODE_NA, ADDR_MODE_INX, ADDR_MODE_NA, ADDR_MODE_INX, ADDR_MODE_NA, ADDR_MODE_ZP, ADDR_MODE_ZP, ADDR_MODE_ZP, // 0x00
+    ADDR_MODE_NA, ADDR_MODE_IMM, ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_ABS, ADDR_MODE_ABS, ADDR_MODE_ABS, // 0x08
+    ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_NA, ADDR_MODE_ZPX, ADDR_MODE_ZPX, ADDR_MODE_ZPX, // 0x10
+    ADDR_MODE_NA, ADDR_MODE_ABY, ADDR_MODE_NA, ADDR_MODE_ABY, ADDR_MODE_ABX, ADDR_MODE_ABX, ADDR_MODE_ABX, ADDR_MODE_ABX, // 0x18
+    ADDR_MODE_ABS, ADDR_MODE_INX, ADDR_MODE_NA, ADDR_MODE_INX, ADDR_MODE_ZP, ADDR_MODE_ZP, ADDR_MODE_ZP, ADDR_MODE_ZP, // 0x20
+    ADDR_MODE_NA, ADDR_MODE_IMM, ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_ABS, ADDR_MODE_ABS, ADDR_MODE_ABS, ADDR_MODE_ABS, // 0x28
+    ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_NA, ADDR_MODE_ZPX, ADDR_MODE_ZPX, ADDR_MODE_ZPX, // 0x30
+    ADDR_MODE_NA, ADDR_MODE_ABY, ADDR_MODE_NA, ADDR_MODE_ABY, ADDR_MODE_ABX, ADDR_MODE_ABX, ADDR_MODE_ABX, ADDR_MODE_ABX, // 0x38
+    ADDR_MODE_NA, ADDR_MODE_INX, ADDR_MODE_NA, ADDR_MODE_INX, ADDR_MODE_NA, ADDR_MODE_ZP, ADDR_MODE_ZP, ADDR_MODE_ZP, // 0x40
+    ADDR_MODE_NA, ADDR_MODE_IMM, ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_ABS, ADDR_MODE_ABS, ADDR_MODE_ABS, ADDR_MODE_ABS, // 0x48
+    ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_NA, ADDR_MODE_ZPX, ADDR_MODE_ZPX, ADDR_MODE_ZPX, // 0x50
+    ADDR_MODE_NA, ADDR_MODE_ABY, ADDR_MODE_NA, ADDR_MODE_ABY, ADDR_MODE_ABX, ADDR_MODE_ABX, ADDR_MODE_ABX, ADDR_MODE_ABX, // 0x58
+    ADDR_MODE_NA, ADDR_MODE_INX, ADDR_MODE_NA, ADDR_MODE_INX, ADDR_MODE_NA, ADDR_MODE_ZP, ADDR_MODE_ZP, ADDR_MODE_ZP, // 0x60
+    ADDR_MODE_NA, ADDR_MODE_IMM, ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_ABS, ADDR_MODE_ABS, ADDR_MODE_ABS, // 0x68
+    ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_NA, ADDR_MODE_ZPX, ADDR_MODE_ZPX, ADDR_MODE_ZPX, // 0x70
+    ADDR_MODE_NA, ADDR_MODE_ABY, ADDR_MODE_NA, ADDR_MODE_ABY, ADDR_MODE_ABX, ADDR_MODE_ABX, ADDR_MODE_ABX, ADDR_MODE_ABX, // 0x78
+    ADDR_MODE_NA, ADDR_MODE_INX, ADDR_MODE_NA, ADDR_MODE_INX, ADDR_MODE_ZP, ADDR_MODE_ZP, ADDR_MODE_ZP, ADDR_MODE_ZP, // 0x80
+    ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_ABS, ADDR_MODE_ABS, ADDR_MODE_ABS, ADDR_MODE_ABS, // 0x88
+    ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_ZPX, ADDR_MODE_ZPX, ADDR_MODE_ZPY, ADDR_MODE_ZPY, // 0x90
+    ADDR_MODE_NA, ADDR_MODE_ABY, ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_ABX, ADDR_MODE_NA, ADDR_MODE_NA, // 0x98
+    ADDR_MODE_IMM, ADDR_MODE_INX, ADDR_MODE_IMM, ADDR_MODE_INX, ADDR_MODE_ZP, ADDR_MODE_ZP, ADDR_MODE_ZP, ADDR_MODE_ZP, // 0xa0
+    ADDR_MODE_NA, ADDR_MODE_IMM, ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_ABS, ADDR_MODE_ABS, ADDR_MODE_ABS, ADDR_MODE_ABS, // 0xa8
+    ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_ZPX, ADDR_MODE_ZPX, ADDR_MODE_ZPY, ADDR_MODE_ZPY, // 0xb0
+    ADDR_MODE_NA, ADDR_MODE_ABY, ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_ABX, ADDR_MODE_ABX, ADDR_MODE_ABY, ADDR_MODE_ABY, // 0xb8
+    ADDR_MODE_IMM, ADDR_MODE_INX, ADDR_MODE_NA, ADDR_MODE_INX, ADDR_MODE_ZP, ADDR_MODE_ZP, ADDR_MODE_ZP, ADDR_MODE_ZP, // 0xc0
+    ADDR_MODE_NA, ADDR_MODE_IMM, ADDR_MODE_NA, ADDR_MODE_NA, ADDR_MODE_ABS, ADDR_MODE_ABS, ADDR_MODE_ABS, ADDR_MODE_ABS, // 0xc8
+    ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_NA, ADDR_MODE_ZPX, ADDR_MODE_ZPX, ADDR_MODE_ZPX, // 0xd0
+    ADDR_MODE_NA, ADDR_MODE_ABY, ADDR_MODE_NA, ADDR_MODE_ABY, ADDR_MODE_ABX, ADDR_MODE_ABX, ADDR_MODE_ABX, ADDR_MODE_ABX, // 0xd8
+    ADDR_MODE_IMM, ADDR_MODE_INX, ADDR_MODE_NA, ADDR_MODE_INX, ADDR_MODE_ZP, ADDR_MODE_ZP, ADDR_MODE_ZP, ADDR_MODE_ZP, // 0xe0
+    ADDR_MODE_NA, ADDR_MODE_IMM, ADDR_MODE_NA, ADDR_MODE_IMM, ADDR_MODE_ABS, ADDR_MODE_ABS, ADDR_MODE_ABS, ADDR_MODE_ABS, // 0xe8
+    ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_NA, ADDR_MODE_INY, ADDR_MODE_NA, ADDR_MODE_ZPX, ADDR_MODE_ZPX, ADDR_MODE_ZPX, // 0xf0
+    ADDR_MODE_NA, ADDR_MODE_ABY, ADDR_MODE_NA, ADDR_MODE_ABY, ADDR_MODE_ABX, ADDR_MODE_ABX, ADDR_MODE_ABX, ADDR_MODE_ABX, // 0xf8
+];
 
-static _SENTINEL: Opcode = Opcode {
-    name: "NOP",
-    size: 0xffff, // Inaccurate, will have to be adjusted
-    cycles: 0xff, // Inaccurate, will have to be adjusted
-    mode: ADDR_MODE_NA,
-    page_boundary_penalty: false
-};
+static PAGE_BOUNDARY_PENALTIES: [bool; 256] = [
+    false, false, false, false, false, false, false, false, // 0x00
+    false, false, false, false, false, false, false, false, // 0x08
+    false, true, false, true, false, false, false, false, // 0x10
+    false, true, false, true, true, true, true, true, // 0x18
+    false, false, false, false, false, false, false, false, // 0x20
+    false, false, false, false, false, false, false, false, // 0x28
+    false, true, false, true, false, false, false, false, // 0x30
+    false, true, false, true, true, true, true, true, // 0x38
+    false, false, false, false, false, false, false, false, // 0x40
+    false, false, false, false, false, false, false, false, // 0x48
+    false, true, false, true, false, false, false, false, // 0x50
+    false, true, false, true, true, true, true, true, // 0x58
+    false, false, false, false, false, false, false, false, // 0x60
+    false, false, false, false, false, false, false, false, // 0x68
+    false, true, false, true, false, false, false, false, // 0x70
+    false, true, false, true, true, true, true, true, // 0x78
+    false, false, false, false, false, false, false, false, // 0x80
+    false, false, false, false, false, false, false, false, // 0x88
+    false, false, false, false, false, false, false, false, // 0x90
+    false, false, false, false, false, false, false, false, // 0x98
+    false, false, false, false, false, false, false, false, // 0xa0
+    false, false, false, false, false, false, false, false, // 0xa8
+    false, true, false, true, false, false, false, false, // 0xb0
+    false, true, false, false, true, true, true, true, // 0xb8
+    false, false, false, false, false, false, false, false, // 0xc0
+    false, false, false, false, false, false, false, false, // 0xc8
+    false, true, false, true, false, false, false, false, // 0xd0
+    false, true, false, true, true, true, true, true, // 0xd8
+    false, false, false, false, false, false, false, false, // 0xe0
+    false, false, false, false, false, false, false, false, // 0xe8
+    false, true, false, true, false, false, false, false, // 0xf0
+    false, true, false, true, true, true, true, true, // 0xf8
+];
 
 impl Lookup {
-    pub fn new() -> Lookup {
-        let mut lookup: [&'static Opcode; 256] = [&_SENTINEL; 256];
-        lookup[ADC_IMM as usize] = &Opcode { // (ADd with Carry)
-            name: "ADC_IMM",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_IMM,
-            page_boundary_penalty: false,
-        };
-        lookup[ADC_ZP as usize] = &Opcode { // (ADd with Carry)
-            name: "ADC_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[ADC_ZPX as usize] = &Opcode { // (ADd with Carry)
-            name: "ADC_ZPX",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[ADC_ABS as usize] = &Opcode { // (ADd with Carry)
-            name: "ADC_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[ADC_ABX as usize] = &Opcode { // (ADd with Carry)
-            name: "ADC_ABX",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[ADC_ABY as usize] = &Opcode { // (ADd with Carry)
-            name: "ADC_ABY",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[ADC_INX as usize] = &Opcode { // (ADd with Carry)
-            name: "ADC_INX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[ADC_INY as usize] = &Opcode { // (ADd with Carry)
-            name: "ADC_INY",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: true,
-        };
-        lookup[AND_IMM as usize] = &Opcode { // (bitwise AND with accumulator)
-            name: "AND_IMM",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_IMM,
-            page_boundary_penalty: false,
-        };
-        lookup[AND_ZP as usize] = &Opcode { // (bitwise AND with accumulator)
-            name: "AND_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[AND_ZPX as usize] = &Opcode { // (bitwise AND with accumulator)
-            name: "AND_ZPX",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[AND_ABS as usize] = &Opcode { // (bitwise AND with accumulator)
-            name: "AND_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[AND_ABX as usize] = &Opcode { // (bitwise AND with accumulator)
-            name: "AND_ABX",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[AND_ABY as usize] = &Opcode { // (bitwise AND with accumulator)
-            name: "AND_ABY",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[AND_INX as usize] = &Opcode { // (bitwise AND with accumulator)
-            name: "AND_INX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[AND_INY as usize] = &Opcode { // (bitwise AND with accumulator)
-            name: "AND_INY",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: true,
-        };
-        lookup[ASL as usize] = &Opcode { // (Arithmetic Shift Left)
-            name: "ASL",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[ASL_ZP as usize] = &Opcode { // (Arithmetic Shift Left)
-            name: "ASL_ZP",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[ASL_ZPX as usize] = &Opcode { // (Arithmetic Shift Left)
-            name: "ASL_ZPX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[ASL_ABS as usize] = &Opcode { // (Arithmetic Shift Left)
-            name: "ASL_ABS",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[ASL_ABX as usize] = &Opcode { // (Arithmetic Shift Left)
-            name: "ASL_ABX",
-            size: 3,
-            cycles: 7,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[BIT_ZP as usize] = &Opcode { // (test BITs)
-            name: "BIT_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[BIT_ABS as usize] = &Opcode { // (test BITs)
-            name: "BIT_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[BPL as usize] = &Opcode { // (Branch on PLus)          
-            name: "BPL",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[BMI as usize] = &Opcode { // (Branch on MInus)         
-            name: "BMI",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[BVC as usize] = &Opcode { // (Branch on oVerflow Clear)
-            name: "BVC",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[BVS as usize] = &Opcode { // (Branch on oVerflow Set)  
-            name: "BVS",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[BCC as usize] = &Opcode { // (Branch on Carry Clear)   
-            name: "BCC",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[BCS as usize] = &Opcode { // (Branch on Carry Set)     
-            name: "BCS",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[BNE as usize] = &Opcode { // (Branch on Not Equal)     
-            name: "BNE",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[BEQ as usize] = &Opcode { // (Branch on EQual)         
-            name: "BEQ",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[BRK as usize] = &Opcode { // (BReaK)
-            name: "BRK",
-            size: 1,
-            cycles: 7,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[CMP_IMM as usize] = &Opcode { // (CoMPare accumulator)
-            name: "CMP_IMM",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_IMM,
-            page_boundary_penalty: false,
-        };
-        lookup[CMP_ZP as usize] = &Opcode { // (CoMPare accumulator)
-            name: "CMP_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[CMP_ZPX as usize] = &Opcode { // (CoMPare accumulator)
-            name: "CMP_ZPX",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[CMP_ABS as usize] = &Opcode { // (CoMPare accumulator)
-            name: "CMP_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[CMP_ABX as usize] = &Opcode { // (CoMPare accumulator)
-            name: "CMP_ABX",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[CMP_ABY as usize] = &Opcode { // (CoMPare accumulator)
-            name: "CMP_ABY",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[CMP_INX as usize] = &Opcode { // (CoMPare accumulator)
-            name: "CMP_INX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[CMP_INY as usize] = &Opcode { // (CoMPare accumulator)
-            name: "CMP_INY",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: true,
-        };
-        lookup[CPX_IMM as usize] = &Opcode { // (ComPare X register)
-            name: "CPX_IMM",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_IMM,
-            page_boundary_penalty: false,
-        };
-        lookup[CPX_ZP as usize] = &Opcode { // (ComPare X register)
-            name: "CPX_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[CPX_ABS as usize] = &Opcode { // (ComPare X register)
-            name: "CPX_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[CPY_IMM as usize] = &Opcode { // (ComPare Y register)
-            name: "CPY_IMM",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_IMM,
-            page_boundary_penalty: false,
-        };
-        lookup[CPY_ZP as usize] = &Opcode { // (ComPare Y register)
-            name: "CPY_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[CPY_ABS as usize] = &Opcode { // (ComPare Y register)
-            name: "CPY_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[DEC_ZP as usize] = &Opcode { // (DECrement memory)
-            name: "DEC_ZP",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[DEC_ZPX as usize] = &Opcode { // (DECrement memory)
-            name: "DEC_ZPX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[DEC_ABS as usize] = &Opcode { // (DECrement memory)
-            name: "DEC_ABS",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[DEC_ABX as usize] = &Opcode { // (DECrement memory)
-            name: "DEC_ABX",
-            size: 3,
-            cycles: 7,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[EOR_IMM as usize] = &Opcode { // (bitwise Exclusive OR)
-            name: "EOR_IMM",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_IMM,
-            page_boundary_penalty: false,
-        };
-        lookup[EOR_ZP as usize] = &Opcode { // (bitwise Exclusive OR)
-            name: "EOR_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[EOR_ZPX as usize] = &Opcode { // (bitwise Exclusive OR)
-            name: "EOR_ZPX",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[EOR_ABS as usize] = &Opcode { // (bitwise Exclusive OR)
-            name: "EOR_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[EOR_ABX as usize] = &Opcode { // (bitwise Exclusive OR)
-            name: "EOR_ABX",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[EOR_ABY as usize] = &Opcode { // (bitwise Exclusive OR)
-            name: "EOR_ABY",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[EOR_INX as usize] = &Opcode { // (bitwise Exclusive OR)
-            name: "EOR_INX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[EOR_INY as usize] = &Opcode { // (bitwise Exclusive OR)
-            name: "EOR_INY",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: true,
-        };
-        lookup[CLC as usize] = &Opcode { // (CLear Carry)             
-            name: "CLC",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[SEC as usize] = &Opcode { // (SEt Carry)               
-            name: "SEC",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[CLI as usize] = &Opcode { // (CLear Interrupt)         
-            name: "CLI",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[SEI as usize] = &Opcode { // (SEt Interrupt)           
-            name: "SEI",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[CLV as usize] = &Opcode { // (CLear oVerflow)          
-            name: "CLV",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[CLD as usize] = &Opcode { // (CLear Decimal)           
-            name: "CLD",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[SED as usize] = &Opcode { // (SEt Decimal)             
-            name: "SED",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[INC_ZP as usize] = &Opcode { // (INCrement memory)
-            name: "INC_ZP",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[INC_ZPX as usize] = &Opcode { // (INCrement memory)
-            name: "INC_ZPX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[INC_ABS as usize] = &Opcode { // (INCrement memory)
-            name: "INC_ABS",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[INC_ABX as usize] = &Opcode { // (INCrement memory)
-            name: "INC_ABX",
-            size: 3,
-            cycles: 7,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[JMP_ABS as usize] = &Opcode { // (JuMP)
-            name: "JMP_ABS",
-            size: 3,
-            cycles: 3,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[JMP_IND as usize] = &Opcode { // (JuMP)
-            name: "JMP_IND",
-            size: 3,
-            cycles: 5,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[JSR_ABS as usize] = &Opcode { // (Jump to SubRoutine)
-            name: "JSR_ABS",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[LDA_IMM as usize] = &Opcode { // (LoaD Accumulator)
-            name: "LDA_IMM",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_IMM,
-            page_boundary_penalty: false,
-        };
-        lookup[LDA_ZP as usize] = &Opcode { // (LoaD Accumulator)
-            name: "LDA_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[LDA_ZPX as usize] = &Opcode { // (LoaD Accumulator)
-            name: "LDA_ZPX",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[LDA_ABS as usize] = &Opcode { // (LoaD Accumulator)
-            name: "LDA_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[LDA_ABX as usize] = &Opcode { // (LoaD Accumulator)
-            name: "LDA_ABX",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[LDA_ABY as usize] = &Opcode { // (LoaD Accumulator)
-            name: "LDA_ABY",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[LDA_INX as usize] = &Opcode { // (LoaD Accumulator)
-            name: "LDA_INX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[LDA_INY as usize] = &Opcode { // (LoaD Accumulator)
-            name: "LDA_INY",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: true,
-        };
-        lookup[LDX_IMM as usize] = &Opcode { // (LoaD X register)
-            name: "LDX_IMM",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_IMM,
-            page_boundary_penalty: false,
-        };
-        lookup[LDX_ZP as usize] = &Opcode { // (LoaD X register)
-            name: "LDX_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[LDX_ZPY as usize] = &Opcode { // (LoaD X register)
-            name: "LDX_ZPY",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_ZPY,
-            page_boundary_penalty: false,
-        };
-        lookup[LDX_ABS as usize] = &Opcode { // (LoaD X register)
-            name: "LDX_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[LDX_ABY as usize] = &Opcode { // (LoaD X register)
-            name: "LDX_ABY",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[LDY_IMM as usize] = &Opcode { // (LoaD Y register)
-            name: "LDY_IMM",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_IMM,
-            page_boundary_penalty: false,
-        };
-        lookup[LDY_ZP as usize] = &Opcode { // (LoaD Y register)
-            name: "LDY_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[LDY_ZPX as usize] = &Opcode { // (LoaD Y register)
-            name: "LDY_ZPX",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[LDY_ABS as usize] = &Opcode { // (LoaD Y register)
-            name: "LDY_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[LDY_ABX as usize] = &Opcode { // (LoaD Y register)
-            name: "LDY_ABX",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[LSR as usize] = &Opcode { // (Logical Shift Right)
-            name: "LSR",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[LSR_ZP as usize] = &Opcode { // (Logical Shift Right)
-            name: "LSR_ZP",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[LSR_ZPX as usize] = &Opcode { // (Logical Shift Right)
-            name: "LSR_ZPX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[LSR_ABS as usize] = &Opcode { // (Logical Shift Right)
-            name: "LSR_ABS",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[LSR_ABX as usize] = &Opcode { // (Logical Shift Right)
-            name: "LSR_ABX",
-            size: 3,
-            cycles: 7,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[NOP as usize] = &Opcode { // (No OPeration)
-            name: "NOP",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[ORA_IMM as usize] = &Opcode { // (bitwise OR with Accumulator)
-            name: "ORA_IMM",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_IMM,
-            page_boundary_penalty: false,
-        };
-        lookup[ORA_ZP as usize] = &Opcode { // (bitwise OR with Accumulator)
-            name: "ORA_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[ORA_ZPX as usize] = &Opcode { // (bitwise OR with Accumulator)
-            name: "ORA_ZPX",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[ORA_ABS as usize] = &Opcode { // (bitwise OR with Accumulator)
-            name: "ORA_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[ORA_ABX as usize] = &Opcode { // (bitwise OR with Accumulator)
-            name: "ORA_ABX",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[ORA_ABY as usize] = &Opcode { // (bitwise OR with Accumulator)
-            name: "ORA_ABY",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[ORA_INX as usize] = &Opcode { // (bitwise OR with Accumulator)
-            name: "ORA_INX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[ORA_INY as usize] = &Opcode { // (bitwise OR with Accumulator)
-            name: "ORA_INY",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: true,
-        };
-        lookup[TAX as usize] = &Opcode { // (Transfer A to X)   
-            name: "TAX",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[TXA as usize] = &Opcode { // (Transfer X to A)   
-            name: "TXA",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[DEX as usize] = &Opcode { // (DEcrement X)       
-            name: "DEX",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[INX as usize] = &Opcode { // (INcrement X)       
-            name: "INX",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[TAY as usize] = &Opcode { // (Transfer A to Y)   
-            name: "TAY",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[TYA as usize] = &Opcode { // (Transfer Y to A)   
-            name: "TYA",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[DEY as usize] = &Opcode { // (DEcrement Y)       
-            name: "DEY",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[INY as usize] = &Opcode { // (INcrement Y)       
-            name: "INY",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[ROL as usize] = &Opcode { // (ROtate Left)
-            name: "ROL",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[ROL_ZP as usize] = &Opcode { // (ROtate Left)
-            name: "ROL_ZP",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[ROL_ZPX as usize] = &Opcode { // (ROtate Left)
-            name: "ROL_ZPX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[ROL_ABS as usize] = &Opcode { // (ROtate Left)
-            name: "ROL_ABS",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[ROL_ABX as usize] = &Opcode { // (ROtate Left)
-            name: "ROL_ABX",
-            size: 3,
-            cycles: 7,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[ROR as usize] = &Opcode { // (ROtate Right)
-            name: "ROR",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[ROR_ZP as usize] = &Opcode { // (ROtate Right)
-            name: "ROR_ZP",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[ROR_ZPX as usize] = &Opcode { // (ROtate Right)
-            name: "ROR_ZPX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[ROR_ABS as usize] = &Opcode { // (ROtate Right)
-            name: "ROR_ABS",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[ROR_ABX as usize] = &Opcode { // (ROtate Right)
-            name: "ROR_ABX",
-            size: 3,
-            cycles: 7,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[RTI as usize] = &Opcode { // (ReTurn from Interrupt)
-            name: "RTI",
-            size: 1,
-            cycles: 6,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[RTS as usize] = &Opcode { // (ReTurn from Subroutine)
-            name: "RTS",
-            size: 1,
-            cycles: 6,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[SBC_IMM as usize] = &Opcode { // (SuBtract with Carry)
-            name: "SBC_IMM",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_IMM,
-            page_boundary_penalty: false,
-        };
-        lookup[SBC_ZP as usize] = &Opcode { // (SuBtract with Carry)
-            name: "SBC_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[SBC_ZPX as usize] = &Opcode { // (SuBtract with Carry)
-            name: "SBC_ZPX",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[SBC_ABS as usize] = &Opcode { // (SuBtract with Carry)
-            name: "SBC_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[SBC_ABX as usize] = &Opcode { // (SuBtract with Carry)
-            name: "SBC_ABX",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[SBC_ABY as usize] = &Opcode { // (SuBtract with Carry)
-            name: "SBC_ABY",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[SBC_INX as usize] = &Opcode { // (SuBtract with Carry)
-            name: "SBC_INX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[SBC_INY as usize] = &Opcode { // (SuBtract with Carry)
-            name: "SBC_INY",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: true,
-        };
-        lookup[STA_ZP as usize] = &Opcode { // (STore Accumulator)
-            name: "STA_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[STA_ZPX as usize] = &Opcode { // (STore Accumulator)
-            name: "STA_ZPX",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[STA_ABS as usize] = &Opcode { // (STore Accumulator)
-            name: "STA_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[STA_ABX as usize] = &Opcode { // (STore Accumulator)
-            name: "STA_ABX",
-            size: 3,
-            cycles: 5,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: false,
-        };
-        lookup[STA_ABY as usize] = &Opcode { // (STore Accumulator)
-            name: "STA_ABY",
-            size: 3,
-            cycles: 5,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: false,
-        };
-        lookup[STA_INX as usize] = &Opcode { // (STore Accumulator)
-            name: "STA_INX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[STA_INY as usize] = &Opcode { // (STore Accumulator)
-            name: "STA_INY",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: false,
-        };
-        lookup[TXS as usize] = &Opcode { // (Transfer X to Stack ptr)  
-            name: "TXS",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[TSX as usize] = &Opcode { // (Transfer Stack ptr to X)  
-            name: "TSX",
-            size: 1,
-            cycles: 2,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[PHA as usize] = &Opcode { // (PusH Accumulator)         
-            name: "PHA",
-            size: 1,
-            cycles: 3,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[PLA as usize] = &Opcode { // (PuLl Accumulator)         
-            name: "PLA",
-            size: 1,
-            cycles: 4,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[PHP as usize] = &Opcode { // (PusH Processor status)    
-            name: "PHP",
-            size: 1,
-            cycles: 3,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[PLP as usize] = &Opcode { // (PuLl Processor status)    
-            name: "PLP",
-            size: 1,
-            cycles: 4,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[STX_ZP as usize] = &Opcode { // (STore X register)
-            name: "STX_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[STX_ZPY as usize] = &Opcode { // (STore X register)
-            name: "STX_ZPY",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_ZPY,
-            page_boundary_penalty: false,
-        };
-        lookup[STX_ABS as usize] = &Opcode { // (STore X register)
-            name: "STX_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[STY_ZP as usize] = &Opcode { // (STore Y register)
-            name: "STY_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[STY_ZPX as usize] = &Opcode { // (STore Y register)
-            name: "STY_ZPX",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[STY_ABS as usize] = &Opcode { // (STore Y register)
-            name: "STY_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[LAX_INX as usize] = &Opcode { // LAX = LDA + LDX (Unofficial opcode)
-            name: "LAX_INX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[LAX_ZP as usize] = &Opcode { // LAX = LDA + LDX (Unofficial opcode)
-            name: "LAX_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[LAX_ABS as usize] = &Opcode { // LAX = LDA + LDX (Unofficial opcode)
-            name: "LAX_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[LAX_INY as usize] = &Opcode { // LAX = LDA + LDX (Unofficial opcode)
-            name: "LAX_INY",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: true,
-        };
-        lookup[LAX_ZPY as usize] = &Opcode { // LAX = LDA + LDX (Unofficial opcode)
-            name: "LAX_ZPY",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_ZPY,
-            page_boundary_penalty: false,
-        };
-        lookup[LAX_ABY as usize] = &Opcode { // LAX = LDA + LDX (Unofficial opcode)
-            name: "LAX_ABY",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[SAX_INX as usize] = &Opcode { // SAX = Store A&X (Unofficial opcode)
-            name: "SAX_INX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[SAX_ZP as usize] = &Opcode { // SAX = Store A&X (Unofficial opcode)
-            name: "SAX_ZP",
-            size: 2,
-            cycles: 3,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[SAX_ABS as usize] = &Opcode { // SAX = Store A&X (Unofficial opcode)
-            name: "SAX_ABS",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[SAX_ZPY as usize] = &Opcode { // SAX = Store A&X (Unofficial opcode)
-            name: "SAX_ZPY",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_ZPY,
-            page_boundary_penalty: false,
-        };
-        lookup[SNC_IMM as usize] = &Opcode { // SNC = SBC + NOP (Unofficial opcode)
-            name: "SNC_IMM",
-            size: 2,
-            cycles: 2,
-            mode: ADDR_MODE_IMM,
-            page_boundary_penalty: false,
-        };
-        lookup[DCP_INX as usize] = &Opcode { // DCP = DEC + CMP (Unofficial opcode)
-            name: "DCP_INX",
-            size: 2,
-            cycles: 8,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[DCP_ZP as usize] = &Opcode { // DCP = DEC + CMP (Unofficial opcode)
-            name: "DCP_ZP",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[DCP_ABS as usize] = &Opcode { // DCP = DEC + CMP (Unofficial opcode)
-            name: "DCP_ABS",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[DCP_INY as usize] = &Opcode { // DCP = DEC + CMP (Unofficial opcode)
-            name: "DCP_INY",
-            size: 2,
-            cycles: 7,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: true,
-        };
-        lookup[DCP_ZPX as usize] = &Opcode { // DCP = DEC + CMP (Unofficial opcode)
-            name: "DCP_ZPX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[DCP_ABY as usize] = &Opcode { // DCP = DEC + CMP (Unofficial opcode)
-            name: "DCP_ABY",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[DCP_ABX as usize] = &Opcode { // DCP = DEC + CMP (Unofficial opcode)
-            name: "DCP_ABX",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[ISB_INX as usize] = &Opcode { // ISB = INC + SBC (Unofficial opcode)
-            name: "ISB_INX",
-            size: 2,
-            cycles: 8,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[ISB_ZP as usize] = &Opcode { // ISB = INC + SBC (Unofficial opcode)
-            name: "ISB_ZP",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[ISB_ABS as usize] = &Opcode { // ISB = INC + SBC (Unofficial opcode)
-            name: "ISB_ABS",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[ISB_INY as usize] = &Opcode { // ISB = INC + SBC (Unofficial opcode)
-            name: "ISB_INY",
-            size: 2,
-            cycles: 7,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: true,
-        };
-        lookup[ISB_ZPX as usize] = &Opcode { // ISB = INC + SBC (Unofficial opcode)
-            name: "ISB_ZPX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[ISB_ABY as usize] = &Opcode { // ISB = INC + SBC (Unofficial opcode)
-            name: "ISB_ABY",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[ISB_ABX as usize] = &Opcode { // ISB = INC + SBC (Unofficial opcode)
-            name: "ISB_ABX",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[SLO_INX as usize] = &Opcode { // SLO = ASL + ORA (Unofficial opcode)
-            name: "SLO_INX",
-            size: 2,
-            cycles: 8,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[SLO_ZP as usize] = &Opcode { // SLO = ASL + ORA (Unofficial opcode)
-            name: "SLO_ZP",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[SLO_ABS as usize] = &Opcode { // SLO = ASL + ORA (Unofficial opcode)
-            name: "SLO_ABS",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[SLO_INY as usize] = &Opcode { // SLO = ASL + ORA (Unofficial opcode)
-            name: "SLO_INY",
-            size: 2,
-            cycles: 7,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: true,
-        };
-        lookup[SLO_ZPX as usize] = &Opcode { // SLO = ASL + ORA (Unofficial opcode)
-            name: "SLO_ZPX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[SLO_ABY as usize] = &Opcode { // SLO = ASL + ORA (Unofficial opcode)
-            name: "SLO_ABY",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[SLO_ABX as usize] = &Opcode { // SLO = ASL + ORA (Unofficial opcode)
-            name: "SLO_ABX",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[RLA_INX as usize] = &Opcode { // RLA = ROL + AND (Unofficial opcode)
-            name: "RLA_INX",
-            size: 2,
-            cycles: 8,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[RLA_ZP as usize] = &Opcode { // RLA = ROL + AND (Unofficial opcode)
-            name: "RLA_ZP",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[RLA_ABS as usize] = &Opcode { // RLA = ROL + AND (Unofficial opcode)
-            name: "RLA_ABS",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[RLA_INY as usize] = &Opcode { // RLA = ROL + AND (Unofficial opcode)
-            name: "RLA_INY",
-            size: 2,
-            cycles: 7,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: true,
-        };
-        lookup[RLA_ZPX as usize] = &Opcode { // RLA = ROL + AND (Unofficial opcode)
-            name: "RLA_ZPX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[RLA_ABY as usize] = &Opcode { // RLA = ROL + AND (Unofficial opcode)
-            name: "RLA_ABY",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[RLA_ABX as usize] = &Opcode { // RLA = ROL + AND (Unofficial opcode)
-            name: "RLA_ABX",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[SRE_INX as usize] = &Opcode { // SRE = LSR + EOR (Unofficial opcode)
-            name: "SRE_INX",
-            size: 2,
-            cycles: 8,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[SRE_ZP as usize] = &Opcode { // SRE = LSR + EOR (Unofficial opcode)
-            name: "SRE_ZP",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[SRE_ABS as usize] = &Opcode { // SRE = LSR + EOR (Unofficial opcode))
-            name: "SRE_ABS",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[SRE_INY as usize] = &Opcode { // SRE = LSR + EOR (Unofficial opcode)
-            name: "SRE_INY",
-            size: 2,
-            cycles: 7,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: true,
-        };
-        lookup[SRE_ZPX as usize] = &Opcode { // SRE = LSR + EOR (Unofficial opcode)
-            name: "SRE_ZPX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[SRE_ABY as usize] = &Opcode { // SRE = LSR + EOR (Unofficial opcode)
-            name: "SRE_ABY",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[SRE_ABX as usize] = &Opcode { // SRE = LSR + EOR (Unofficial opcode)
-            name: "SRE_ABX",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[RRA_INX as usize] = &Opcode { // RRA = ROR + ADC (Unofficial opcode)
-            name: "RRA_INX",
-            size: 2,
-            cycles: 8,
-            mode: ADDR_MODE_INX,
-            page_boundary_penalty: false,
-        };
-        lookup[RRA_ZP as usize] = &Opcode { // RRA = ROR + ADC (Unofficial opcode)
-            name: "RRA_ZP",
-            size: 2,
-            cycles: 5,
-            mode: ADDR_MODE_ZP,
-            page_boundary_penalty: false,
-        };
-        lookup[RRA_ABS as usize] = &Opcode { // RRA = ROR + ADC (Unofficial opcode)
-            name: "RRA_ABS",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABS,
-            page_boundary_penalty: false,
-        };
-        lookup[RRA_INY as usize] = &Opcode { // RRA = ROR + ADC (Unofficial opcode)
-            name: "RRA_INY",
-            size: 2,
-            cycles: 7,
-            mode: ADDR_MODE_INY,
-            page_boundary_penalty: true,
-        };
-        lookup[RRA_ZPX as usize] = &Opcode { // RRA = ROR + ADC (Unofficial opcode)
-            name: "RRA_ZPX",
-            size: 2,
-            cycles: 6,
-            mode: ADDR_MODE_ZPX,
-            page_boundary_penalty: false,
-        };
-        lookup[RRA_ABY as usize] = &Opcode { // RRA = ROR + ADC (Unofficial opcode)
-            name: "RRA_ABY",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABY,
-            page_boundary_penalty: true,
-        };
-        lookup[RRA_ABX as usize] = &Opcode { // RRA = ROR + ADC (Unofficial opcode)
-            name: "RRA_ABX",
-            size: 3,
-            cycles: 6,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[N1C_ABX as usize] = &Opcode { // NOP (Unofficial opcode)
-            name: "N1C_ABX",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[N3C_ABX as usize] = &Opcode { // NOP (Unofficial opcode)
-            name: "N3C_ABX",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[N5C_ABX as usize] = &Opcode { // NOP (Unofficial opcode)
-            name: "N5C_ABX",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[N7C_ABX as usize] = &Opcode { // NOP (Unofficial opcode)
-            name: "N7C_ABX",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[NDC_ABX as usize] = &Opcode { // NOP (Unofficial opcode)
-            name: "NDC_ABX",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[NFC_ABX as usize] = &Opcode { // NOP (Unofficial opcode)
-            name: "NFC_ABX",
-            size: 3,
-            cycles: 4,
-            mode: ADDR_MODE_ABX,
-            page_boundary_penalty: true,
-        };
-        lookup[NOP_14 as usize] = &Opcode { // NOP (Unofficial opcode)
-            name: "NOP_14",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[NOP_34 as usize] = &Opcode { // NOP (Unofficial opcode)
-            name: "NOP_34",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[NOP_54 as usize] = &Opcode { // NOP (Unofficial opcode)
-            name: "NOP_54",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[NOP_74 as usize] = &Opcode { // NOP (Unofficial opcode)
-            name: "NOP_74",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[NOP_D4 as usize] = &Opcode { // NOP (Unofficial opcode)
-            name: "NOP_D4",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        lookup[NOP_F4 as usize] = &Opcode { // NOP (Unofficial opcode)
-            name: "NOP_F4",
-            size: 2,
-            cycles: 4,
-            mode: ADDR_MODE_NA,
-            page_boundary_penalty: false,
-        };
-        Lookup { opcodes: lookup }
+    pub const fn new() -> Lookup {
+        Lookup
     }
 
+    #[inline(always)]
     pub fn name(&self, opcode: u8) -> &str {
-        self.opcodes[opcode as usize].name
+        let (offset, len) = NAME_SPANS[opcode as usize];
+        &NAMES_BLOB[offset as usize..offset as usize + len as usize]
     }
 
+    #[inline(always)]
     pub fn size(&self, opcode: u8) -> u16 {
-        let size = self.opcodes[opcode as usize].size;
-        if size == 0xffff {
-            // Handle NOPs
-            // https://wiki.nesdev.com/w/index.php/CPU_unofficial_opcodes
-            match opcode & 0xf {
-                0x0 => 2, // #i
-                0x2 => 1, // #
-                0x4 => 2, // d
-                0xc => 3, // a
-                _ => {
-                    1
-                }
-            }
-        } else {
-            size
-        }
+        SIZES[opcode as usize]
     }
 
+    #[inline(always)]
     pub fn cycles(&self, opcode: u8) -> u8 {
-        let cycles = self.opcodes[opcode as usize].cycles;
-        if cycles == 0xff {
-            // Handle NOPs
-            match opcode & 0xf {
-                0x0 => 2,
-                0x2 => 2,
-                0x4 => 3,
-                0xc => 4,
-                _ => 2,
-            }
-        } else {
-            cycles
-        }
+        CYCLES[opcode as usize]
     }
 
+    #[inline(always)]
     pub fn mode(&self, opcode: u8) -> usize {
-        self.opcodes[opcode as usize].mode
+        MODES[opcode as usize]
     }
 
+    #[inline(always)]
     pub fn page_boundary_penalty(&self, opcode: u8) -> bool {
-        self.opcodes[opcode as usize].page_boundary_penalty
+        PAGE_BOUNDARY_PENALTIES[opcode as usize]
     }
 }
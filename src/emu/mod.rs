@@ -27,7 +27,7 @@ pub enum CycleState {
 
 pub struct Emulator {
     pub cpu: cpu::Cpu,
-    lookup: Box<opcodes::Lookup>,
+    lookup: opcodes::Lookup,
     pub mem: Box<dyn memory::MemoryMapper>,
     pub ppu: Rc<RefCell<ppu::PPU>>,
 
@@ -78,7 +78,7 @@ impl Emulator {
         iohandler: Box<dyn io::IOHandler>,
         mut mapper: Box<dyn memory::MemoryMapper>,
     ) -> Emulator {
-        let lookup: Box<opcodes::Lookup> = Box::new(opcodes::Lookup::new());
+        let lookup = opcodes::Lookup::new();
 
         let mut cpu = cpu::Cpu::new();
         cpu.pc = mapper.code_start();